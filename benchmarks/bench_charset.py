@@ -0,0 +1,110 @@
+# benchmarks/bench_charset.py
+# 기사 페이지 디코딩 비교: decode_html(헤더/메타/바이트 검사 후 한 번 디코딩) vs 이전 방식(chardet 계열 apparent_encoding)
+# UTF-8 / EUC-KR / CP949 전용 글자 / BOM / 잘못된 헤더가 섞인 한국어 페이지 코퍼스를 만들어
+#  - 원문과 같게 디코딩된 비율(U+FFFD 없이)
+#  - 페이지당 디코딩 시간
+# 을 출력한다. 네트워크 호출 없음.
+# 실행: python benchmarks/bench_charset.py [--pages 200] [--repeat 3]
+import argparse
+import codecs
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_charset import decode_html
+
+SENTENCES = [
+    "국회는 18일 본회의를 열어 내년도 예산안을 처리했다.",
+    "여야는 막판까지 쟁점 예산을 두고 협상을 이어갔다.",
+    "정부는 이번 예산이 민생 안정에 초점을 맞췄다고 설명했다.",
+    "야당은 일부 항목의 삭감을 요구하며 반발했다.",
+    "전문가들은 재정 건전성 문제를 지적했다.",
+    "서울 시내 곳곳에서 시민들의 반응이 엇갈렸다.",
+    "온라인에서는 관련 밈이 빠르게 퍼지고 있다.",
+]
+# EUC-KR(KS X 1001)에는 없고 CP949에만 있는 글자가 들어간 문장
+CP949_ONLY = ["똠방각하 논란이 다시 불거졌다.", "햏자 밈이 커뮤니티에서 화제가 됐다."]
+
+
+def _page(rng: random.Random, meta: str, extended: bool) -> str:
+    sentences = [rng.choice(SENTENCES) for _ in range(rng.randint(40, 120))]
+    if extended:
+        sentences.insert(rng.randrange(len(sentences)), rng.choice(CP949_ONLY))
+    body = "\n".join(f"<p>{sentence}</p>" for sentence in sentences)
+    return f"<html><head>{meta}<title>뉴스</title></head><body><div id=\"dic_area\">{body}</div></body></html>"
+
+
+def build_corpus(pages: int, seed: int = 0) -> list:
+    """(이름, 바이트, 헤더, 원문) 목록"""
+    rng = random.Random(seed)
+    variants = [
+        # 이름, 코덱, Content-Type, meta 태그, CP949 전용 글자 포함, BOM
+        ("utf8-header", "utf-8", "text/html; charset=UTF-8", "", False, b""),
+        ("utf8-none", "utf-8", "text/html", "", False, b""),
+        ("utf8-bom", "utf-8", "text/html", "", False, codecs.BOM_UTF8),
+        ("euckr-header", "euc-kr", "text/html; charset=EUC-KR", "", False, b""),
+        ("euckr-meta", "euc-kr", "text/html", '<meta http-equiv="Content-Type" content="text/html; charset=euc-kr">', False, b""),
+        ("euckr-none", "euc-kr", "text/html", "", False, b""),
+        ("cp949-as-euckr", "cp949", "text/html; charset=euc-kr", "", True, b""),
+        ("cp949-latin1-header", "cp949", "text/html; charset=ISO-8859-1", '<meta charset="ks_c_5601-1987">', True, b""),
+        ("cp949-wrong-header", "cp949", "text/html; charset=utf-8", "", True, b""),
+    ]
+    corpus = []
+    for i in range(pages):
+        name, encoding, content_type, meta, extended, bom = variants[i % len(variants)]
+        text = _page(rng, meta, extended)
+        corpus.append((name, bom + text.encode(encoding), {"Content-Type": content_type}, text))
+    return corpus
+
+
+def decode_previous(body: bytes, headers: dict) -> str:
+    # 이전 _fetch_url: response.encoding = response.apparent_encoding 후 response.text
+    from requests.compat import chardet
+    return body.decode(chardet.detect(body)["encoding"] or "utf-8", errors="replace")
+
+
+def decode_new(body: bytes, headers: dict) -> str:
+    return decode_html(body, headers)[0]
+
+
+def _measure(decode, corpus, repeat):
+    best = None
+    correct = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outputs = [decode(body, headers) for _, body, headers, _ in corpus]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    for (name, _, _, text), output in zip(corpus, outputs):
+        ok, total = correct.get(name, (0, 0))
+        correct[name] = (ok + (output.lstrip("\ufeff") == text), total + 1)
+    return best, correct
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.pages)
+    size_mb = sum(len(body) for _, body, _, _ in corpus) / 1024 / 1024
+    print(f"코퍼스: {len(corpus)}페이지, {size_mb:.1f}MB")
+
+    for label, decode in (("이전 방식(apparent_encoding)", decode_previous), ("decode_html", decode_new)):
+        try:
+            seconds, correct = _measure(decode, corpus, args.repeat)
+        except ImportError as e:
+            print(f"⚠️ {label}: 실행 불가 ({e})")
+            continue
+        ok = sum(count for count, _ in correct.values())
+        print(f"\n{label}: 정확도 {ok}/{len(corpus)}, {seconds * 1000 / len(corpus):.2f}ms/페이지, {size_mb / seconds:.1f}MB/s")
+        for name, (count, total) in correct.items():
+            print(f"  {name:<22} {count}/{total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# benchmarks/bench_import.py
+# 공개 진입점별 콜드 스타트(import) 시간 측정 및 회귀 방지
+# `python -X importtime`으로 새 인터프리터에서 main을 임포트/호출하고,
+#  - main 임포트부터 진입점 호출까지의 누적 임포트 시간
+#  - 가벼운 진입점이 crewai/crewai_tools/litellm을 끌어오지 않는지
+# 를 확인한다. 예산 초과 또는 무거운 모듈 로드 시 종료 코드 1을 반환.
+# 실행: python benchmarks/bench_import.py [--budget-ms 400] [--repeat 3]
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["crewai", "crewai_tools", "litellm"]
+
+SAMPLE_TRANSLATION = '**Key Visual Keywords:** ["National Assembly", "Seoul", "Police"]'
+
+# (이름, 실행 코드, 무거운 모듈 금지 여부)
+ENTRY_POINTS = [
+    ("import main", "import main", True),
+    (
+        "extract_keywords_from_translation",
+        f"import main; main.extract_keywords_from_translation({SAMPLE_TRANSLATION!r})",
+        True,
+    ),
+    (
+        "generate_image_for_team (translation only)",
+        f"import main; main.generate_image_for_team({{'translation_result': {SAMPLE_TRANSLATION!r}}})",
+        True,
+    ),
+    ("MemeAgentCrew (full pipeline setup)", "import main; main.MemeAgentCrew().search_agent", False),
+]
+
+_REPORT = (
+    "; import sys, json; print(json.dumps(sorted(m for m in {heavy!r} if m in sys.modules)))"
+)
+
+
+def _run(code: str, env: dict):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code + _REPORT.format(heavy=HEAVY_MODULES)],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed")
+
+    # 형식: "import time: self [us] | cumulative | imported package" (하위 임포트는 들여쓰기됨)
+    # main 임포트 이후 호출 과정에서 지연 임포트된 모듈까지 포함하려면 최상위 항목을 합산
+    total_us = 0
+    seen_main = False
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2]
+        if name.strip() == "main":
+            seen_main = True
+        if seen_main and name == " " + name.strip():
+            total_us += int(parts[1])
+    loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+    return total_us / 1000, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=400.0, help="가벼운 진입점의 임포트 시간 예산")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    # 이미지 검색은 키가 없으면 네트워크 호출 없이 반환되므로 측정 중 외부 호출 방지
+    # (빈 값으로 두어야 load_dotenv가 .env의 실제 키로 덮어쓰지 않음)
+    env["SERPER_API_KEY"] = ""
+    env.setdefault("GEMINI_API_KEY", "bench-dummy")
+
+    failed = False
+    for name, code, must_be_light in ENTRY_POINTS:
+        run_env = env if must_be_light else dict(env, SERPER_API_KEY="bench-dummy")
+        try:
+            runs = [_run(code, run_env) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"⚠️ {name}: 실행 실패 ({e})")
+            failed = failed or must_be_light
+            continue
+
+        best_ms = min(ms for ms, _ in runs)
+        loaded = runs[-1][1]
+        status = "✅"
+        if must_be_light and (loaded or best_ms > args.budget_ms):
+            status = "❌"
+            failed = True
+        print(f"{status} {name}: import {best_ms:.1f}ms, 무거운 모듈: {loaded or '없음'}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
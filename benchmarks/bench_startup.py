@@ -0,0 +1,61 @@
+# benchmarks/bench_startup.py
+# MemeAgentCrew 생성 비용 측정: 지연 생성(현재) vs 모든 에이전트/도구/LLM 즉시 생성(이전 방식)
+# 실행: python benchmarks/bench_startup.py [반복 횟수]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 생성 비용만 측정하므로 실제 키가 없어도 동작하도록 더미 키 설정 (네트워크 호출 없음)
+os.environ.setdefault("SERPER_API_KEY", "bench-dummy")
+os.environ.setdefault("GEMINI_API_KEY", "bench-dummy")
+
+from main import MemeAgentCrew
+
+AGENT_NAMES = [
+    "search_agent", "extractor_agent", "translator_agent",
+    "description_agent", "writer_agent", "tokenomics_agent", "summary_agent",
+]
+
+
+def _build_lazy():
+    return MemeAgentCrew()
+
+
+def _build_eager():
+    # 이전 __init__처럼 파이프라인이 쓰는 7개 에이전트(및 연결된 도구/LLM)를 모두 즉시 생성
+    crew = MemeAgentCrew()
+    for name in AGENT_NAMES:
+        getattr(crew, name)
+    return crew
+
+
+def _measure(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2], timings[0], timings[-1]
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    # 첫 생성 시 발생하는 모듈 내부 초기화 비용은 측정에서 제외
+    _build_eager()
+
+    eager = _measure(_build_eager, repeat)
+    lazy = _measure(_build_lazy, repeat)
+
+    print(f"반복 횟수: {repeat}")
+    print(f"이전 방식(즉시 생성)  median={eager[0]*1000:.2f}ms min={eager[1]*1000:.2f}ms max={eager[2]*1000:.2f}ms")
+    print(f"현재 방식(지연 생성)  median={lazy[0]*1000:.2f}ms min={lazy[1]*1000:.2f}ms max={lazy[2]*1000:.2f}ms")
+    if lazy[0] > 0:
+        print(f"생성 시간 단축: {eager[0] / lazy[0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# content_quality.py
+# 수집한 기사 텍스트가 추출할 만한 한국어 뉴스 본문인지 판정하는 결정적 품질 필터 (네트워크/LLM 호출 없음)
+import re
+from collections import Counter
+
+# main.py에서 추출 에이전트에 넘기기 전에 적용하며, 기준은 기존 추출 프롬프트의 규칙과 동일
+# 반복 패턴은 반복 길이가 상한으로 묶인 역참조 정규식이라 위치마다 상수 작업만 하므로 전체가 선형 시간
+_CHAR_RUN_RE = re.compile(r"(\S)\1{20,}")            # 같은 문자 21회 이상 연속
+_PAIR_RUN_RE = re.compile(r"(\S\S)\1{30,}")          # 2글자 패턴 31회 이상 연속
+_TRIPLE_RUN_RE = re.compile(r"(\S{3})\1{100,}")       # 3글자 패턴 101회 이상 연속
+_HTML_TAG_RE = re.compile(r"</?(?:div|span|p|a|li|ul|ol|td|tr|table|script|style|br|img|iframe|section|article|header|footer|nav)\b[^>]*>", re.I)
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?。])\s+|\n+")
+_HANGUL_RE = re.compile(r"[\uac00-\ud7a3]")
+_BOILERPLATE_RE = re.compile(
+    r"로그인|회원가입|비밀번호|구독|쿠키|개인정보\s*(?:처리|보호)|이용약관|무단\s*전재|재배포\s*금지|페이지를 찾을 수 없"
+    r"|cookie|privacy policy|terms of (?:use|service)|sign in|log in|subscribe|page not found",
+    re.I,
+)
+
+def _is_hangul(ch: str) -> bool:
+    return "\uac00" <= ch <= "\ud7a3" or "\u1100" <= ch <= "\u11ff" or "\u3130" <= ch <= "\u318f"
+
+def check_content_quality(text: str) -> dict:
+    """수집한 기사 텍스트가 추출할 만한 한국어 뉴스 본문인지 결정적으로 판정
+
+    반환: {"ok": bool, "reasons": [실패한 규칙 코드], "metrics": {판정에 쓴 수치}}
+    """
+    text = text or ""
+    reasons = []
+    chars = Counter(ch for ch in text if not ch.isspace())
+    visible = sum(chars.values())
+    top_ratio = chars.most_common(1)[0][1] / visible if visible else 0.0
+    letters = sum(n for ch, n in chars.items() if ch.isalpha())
+    hangul = sum(n for ch, n in chars.items() if _is_hangul(ch))
+    non_korean_ratio = (letters - hangul) / letters if letters else 1.0
+
+    # 짧은 조각(사진 설명, 기자명 등)은 문장 수/중복 판정에서 제외
+    sentences = [" ".join(part.split()) for part in SENTENCE_SPLIT_RE.split(text)]
+    sentences = [sentence for sentence in sentences if len(sentence) >= 10]
+    sentence_counts = Counter(sentences)
+    korean_sentences = sum(1 for sentence in sentence_counts if len(_HANGUL_RE.findall(sentence)) >= 5)
+    html_tags = sum(1 for _ in _HTML_TAG_RE.finditer(text))
+    lines = [line for line in text.split("\n") if line.strip()]
+    boilerplate_chars = sum(len(line) for line in lines if _BOILERPLATE_RE.search(line))
+    boilerplate_ratio = boilerplate_chars / sum(len(line) for line in lines) if lines else 0.0
+
+    if _CHAR_RUN_RE.search(text):
+        reasons.append("char_run")
+    if top_ratio >= 0.8:
+        reasons.append("identical_chars")
+    if _PAIR_RUN_RE.search(text):
+        reasons.append("pair_run")
+    if _TRIPLE_RUN_RE.search(text):
+        reasons.append("triple_run")
+    if len(text.strip()) < 100:
+        reasons.append("too_short")
+    if len(text) > 5000 and len(chars) < 50:
+        reasons.append("low_diversity")
+    if sentence_counts and sentence_counts.most_common(1)[0][1] >= 3:
+        reasons.append("repeated_sentence")
+    if korean_sentences < 5:
+        reasons.append("few_korean_sentences")
+    if html_tags > 15:
+        reasons.append("html_tags")
+    if non_korean_ratio > 0.3:
+        reasons.append("non_korean")
+    if boilerplate_ratio > 0.5:
+        reasons.append("boilerplate")
+
+    return {
+        "ok": not reasons,
+        "reasons": reasons,
+        "metrics": {
+            "length": len(text),
+            "unique_chars": len(chars),
+            "top_char_ratio": round(top_ratio, 3),
+            "korean_sentences": korean_sentences,
+            "non_korean_ratio": round(non_korean_ratio, 3),
+            "html_tags": html_tags,
+            "boilerplate_ratio": round(boilerplate_ratio, 3),
+        },
+    }
@@ -0,0 +1,69 @@
+# html_charset.py
+# 기사 페이지 HTML 바이트의 코덱 판정과 디코딩 (EUC-KR/cp949와 UTF-8이 섞인 한국어 언론사 페이지 대상, 네트워크 호출 없음)
+import codecs
+import re
+
+# EUC-KR 계열 이름은 모두 상위 호환인 cp949로 디코딩 (EUC-KR에 없는 '똠', '햏' 같은 글자가 섞여도 깨지지 않도록)
+_CHARSET_ALIASES = {
+    "euc-kr": "cp949", "euc_kr": "cp949", "euckr": "cp949", "ks_c_5601-1987": "cp949", "ks_c_5601": "cp949",
+    "ksc5601": "cp949", "x-windows-949": "cp949", "windows-949": "cp949", "ms949": "cp949", "uhc": "cp949",
+}
+# 한국어 페이지에서 이 선언은 대개 서버 기본값이라 믿지 않고 바이트 통계로 판단
+UNTRUSTED_CHARSETS = {"iso8859-1", "cp1252"}
+_BOMS = [(codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16")]
+_HEADER_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_UTF8_SEQUENCE_RE = re.compile(rb"[\xc2-\xdf][\x80-\xbf]|[\xe0-\xef][\x80-\xbf]{2}|[\xf0-\xf4][\x80-\xbf]{3}")
+_CP949_PAIR_RE = re.compile(rb"[\x81-\xfe][\x41-\x5a\x61-\x7a\x81-\xfe]")
+
+def normalize_charset(name: str):
+    """charset 이름을 파이썬 코덱 이름으로 변환 (EUC-KR 계열 → cp949). 알 수 없는 이름이면 None"""
+    if not name:
+        return None
+    name = name.strip().strip("\"'").lower()
+    try:
+        return codecs.lookup(_CHARSET_ALIASES.get(name, name)).name
+    except LookupError:
+        return None
+
+def header_charset(headers) -> str:
+    """Content-Type 헤더에 선언된 charset을 코덱 이름으로 반환 (없거나 알 수 없으면 None)"""
+    match = _HEADER_CHARSET_RE.search((headers or {}).get("Content-Type", ""))
+    return normalize_charset(match.group(1)) if match else None
+
+def _strict_decode(body: bytes, encoding: str):
+    """엄격 모드 디코딩 (바이트 한도에서 잘린 마지막 글자는 무시). 실패하면 None"""
+    try:
+        return codecs.getincrementaldecoder(encoding)("strict").decode(body, final=False)
+    except (UnicodeDecodeError, LookupError):
+        return None
+
+def decode_html(body: bytes, headers=None) -> tuple:
+    """HTML 바이트를 알맞은 코덱으로 한 번에 디코딩
+
+    BOM → Content-Type charset → <meta charset> → 바이트 검사(UTF-8, cp949 순) 순서로 정하고,
+    선언된 코덱으로 엄격 디코딩이 실패하면 다음 후보로 넘어간다. 모두 실패하면 UTF-8/cp949 바이트 패턴이
+    더 많은 쪽으로 깨진 바이트만 치환해 디코딩한다. 반환: (텍스트, 코덱, 판단 근거)
+    """
+    for bom, encoding in _BOMS:
+        if body.startswith(bom):
+            return body.decode(encoding, errors="replace"), encoding, "bom"
+
+    candidates = [(header_charset(headers), "header")]
+    match = _META_CHARSET_RE.search(body[:4096])
+    if match:
+        candidates.append((normalize_charset(match.group(1).decode("ascii", "ignore")), "meta"))
+    candidates += [("utf-8", "bytes"), ("cp949", "bytes")]
+
+    tried = set()
+    for encoding, source in candidates:
+        if not encoding or encoding in tried or encoding in UNTRUSTED_CHARSETS:
+            continue
+        tried.add(encoding)
+        text = _strict_decode(body, encoding)
+        if text is not None:
+            return text, encoding, source
+
+    utf8_sequences = len(_UTF8_SEQUENCE_RE.findall(body))
+    encoding = "utf-8" if utf8_sequences * 2 >= len(_CP949_PAIR_RE.findall(body)) else "cp949"
+    return body.decode(encoding, errors="replace"), encoding, "fallback"
@@ -1,15 +1,36 @@
 # main.py
 import os
+import sys
+import atexit
+import codecs
+import contextvars
 from dotenv import load_dotenv
-from crewai import Agent, Task, Crew, Process, LLM
-from crewai_tools import SerperDevTool, ScrapeWebsiteTool
-from crewai.tools import tool
 from typing import Dict, Any
+from functools import cached_property, lru_cache
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import json
 import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import hashlib
+import zlib
+import random
+import math
 from datetime import datetime
+from collections import Counter, OrderedDict
+from urllib.parse import urlsplit, parse_qsl
 import requests
 
+from content_quality import SENTENCE_SPLIT_RE, check_content_quality
+from html_charset import UNTRUSTED_CHARSETS, decode_html, header_charset
+from news_url import NAVER_ARTICLE_PATH, canonicalize_url
+
+# crewai / crewai_tools(및 litellm)는 임포트 비용이 크므로 실제로 필요한 코드 경로에서만 임포트한다.
+# 키워드 추출, 이미지 검색 같은 가벼운 진입점은 crewai 없이 동작해야 함 (benchmarks/bench_import.py 참고)
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -23,32 +44,1514 @@ def _check_serper_key():
     if not os.getenv("SERPER_API_KEY"):
         raise RuntimeError("Set SERPER_API_KEY in your .env (required by SerperDevTool)")
 
+# Serper 호출용 HTTP 설정 (연결/읽기 타임아웃 초, 호스트당 최대 연결 수, 연결 리셋 시 재시도 횟수)
+SERPER_BASE_URL = "https://google.serper.dev"
+SERPER_CONNECT_TIMEOUT = float(os.getenv("SERPER_CONNECT_TIMEOUT", "3.05"))
+SERPER_READ_TIMEOUT = float(os.getenv("SERPER_READ_TIMEOUT", "15"))
+SERPER_MAX_CONNECTIONS = int(os.getenv("SERPER_MAX_CONNECTIONS", "10"))
+SERPER_MAX_RETRIES = int(os.getenv("SERPER_MAX_RETRIES", "2"))
+# 키워드별 이미지 검색 동시 실행 수
+SERPER_IMAGE_CONCURRENCY = int(os.getenv("SERPER_IMAGE_CONCURRENCY", "4"))
+# 이미지 검색 1건을 이전처럼 수집 에이전트(Gemini Flash)로 처리했다면 걸렸을 LLM 시간의 가정치.
+# 절감량은 이번 실행에서 잰 Gemini Flash 호출 평균으로 계산하고, 잰 값이 없을 때(모두 캐시 적중)만 이 값을 가정치로 표시해 사용
+COLLECTOR_LLM_SECONDS_ESTIMATE = float(os.getenv("COLLECTOR_LLM_SECONDS_ESTIMATE", "4.0"))
+# 서로 독립적인 파이프라인 단계의 최대 동시 실행 수
+MEME_STAGE_CONCURRENCY = int(os.getenv("MEME_STAGE_CONCURRENCY", "4"))
+
+# 영속 캐시 설정 (SQLite 파일 하나를 여러 프로세스/워커가 공유)
+MEME_CACHE_PATH = os.getenv("MEME_CACHE_PATH", "./cache/meme_cache.sqlite3")
+SERPER_SEARCH_CACHE_TTL = float(os.getenv("SERPER_SEARCH_CACHE_TTL", "1800"))
+SERPER_SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SERPER_SEARCH_CACHE_MAX_ENTRIES", "5000"))
+SERPER_SEARCH_CACHE_MAX_BYTES = int(os.getenv("SERPER_SEARCH_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# 이미지 검색 캐시: 결과 있음/없음("No image found") TTL을 분리, 메모리(1차) + SQLite(2차)
+SERPER_IMAGE_CACHE_TTL = float(os.getenv("SERPER_IMAGE_CACHE_TTL", str(7 * 24 * 3600)))
+SERPER_IMAGE_CACHE_NEGATIVE_TTL = float(os.getenv("SERPER_IMAGE_CACHE_NEGATIVE_TTL", "3600"))
+SERPER_IMAGE_CACHE_MAX_ENTRIES = int(os.getenv("SERPER_IMAGE_CACHE_MAX_ENTRIES", "20000"))
+SERPER_IMAGE_MEMORY_CACHE_SIZE = int(os.getenv("SERPER_IMAGE_MEMORY_CACHE_SIZE", "1024"))
+SERPER_IMAGE_MEMORY_CACHE_TTL = float(os.getenv("SERPER_IMAGE_MEMORY_CACHE_TTL", "600"))
+# 기사 페이지 캐시: 보관 기간, 재검증 없이 바로 쓰는 기간(초), 크기 한도
+ARTICLE_CACHE_TTL = float(os.getenv("ARTICLE_CACHE_TTL", str(7 * 24 * 3600)))
+ARTICLE_CACHE_FRESH_SECONDS = float(os.getenv("ARTICLE_CACHE_FRESH_SECONDS", "600"))
+ARTICLE_CACHE_MAX_ENTRIES = int(os.getenv("ARTICLE_CACHE_MAX_ENTRIES", "5000"))
+ARTICLE_CACHE_MAX_BYTES = int(os.getenv("ARTICLE_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+ARTICLE_CONNECT_TIMEOUT = float(os.getenv("ARTICLE_CONNECT_TIMEOUT", "5"))
+ARTICLE_READ_TIMEOUT = float(os.getenv("ARTICLE_READ_TIMEOUT", "20"))
+# 기사 페이지 최대 수신 바이트(초과분은 읽지 않음)와, 수신 중 이 길이 이상 같은 1~3글자 패턴이 이어지면 연결을 끊는 기준
+ARTICLE_MAX_BYTES = int(os.getenv("ARTICLE_MAX_BYTES", str(2 * 1024 * 1024)))
+ARTICLE_ABORT_REPEAT_CHARS = int(os.getenv("ARTICLE_ABORT_REPEAT_CHARS", "2000"))
+# 추출 단계의 기사 동시 수집: 전체/도메인별 동시 요청 수, URL당 최대 소요 시간(초), 이만큼 좋은 기사가 모이면 나머지는 기다리지 않음
+ARTICLE_FETCH_CONCURRENCY = int(os.getenv("ARTICLE_FETCH_CONCURRENCY", "6"))
+ARTICLE_DOMAIN_CONCURRENCY = int(os.getenv("ARTICLE_DOMAIN_CONCURRENCY", "2"))
+ARTICLE_URL_DEADLINE = float(os.getenv("ARTICLE_URL_DEADLINE", "30"))
+EXTRACTION_TARGET_ARTICLES = int(os.getenv("EXTRACTION_TARGET_ARTICLES", "3"))
+# 번역(Gemini Pro) 단계 입력 토큰 상한(0이면 자르지 않음), 기사마다 항상 남길 첫 문장 수, 이 이상 겹치는 문장은 중복으로 제거
+TRANSLATION_TOKEN_BUDGET = int(os.getenv("TRANSLATION_TOKEN_BUDGET", "4000"))
+TRANSLATION_LEAD_SENTENCES = int(os.getenv("TRANSLATION_LEAD_SENTENCES", "3"))
+TRANSLATION_OVERLAP_THRESHOLD = float(os.getenv("TRANSLATION_OVERLAP_THRESHOLD", "0.6"))
+# LLM 응답 캐시: on(기본) / off / replay(캐시에서만 응답, 미스 시 에러) / refresh(조회 없이 새로 저장)
+# on/refresh는 실행별 검색/기사/이미지 결과도 함께 기록하고, replay는 이를 재생해 네트워크 없이 실행 전체를 다시 돌린다
+MEME_LLM_CACHE_MODE = os.getenv("MEME_LLM_CACHE_MODE", "on").lower()
+# 프롬프트/에이전트 설정을 바꿔 기존 응답(과 번역 메모)을 무효화하려면 이 값을 올린다
+MEME_LLM_PROMPT_VERSION = os.getenv("MEME_LLM_PROMPT_VERSION", "1")
+MEME_LLM_CACHE_TTL = float(os.getenv("MEME_LLM_CACHE_TTL", str(30 * 24 * 3600)))
+MEME_LLM_CACHE_MAX_BYTES = int(os.getenv("MEME_LLM_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# 같은 keyword/why_trending의 번역(검색→추출→번역) 결과를 재사용하는 기간(초)
+TRANSLATION_MEMO_TTL = float(os.getenv("TRANSLATION_MEMO_TTL", "3600"))
+# 수집 실패 URL 네거티브 캐시(초, 실패가 반복될수록 2배씩 증가)와 도메인 단위 백오프 설정
+URL_FAILURE_TTL = float(os.getenv("URL_FAILURE_TTL", "3600"))
+URL_FAILURE_MAX_TTL = float(os.getenv("URL_FAILURE_MAX_TTL", str(7 * 24 * 3600)))
+DOMAIN_BACKOFF_AFTER_FAILURES = int(os.getenv("DOMAIN_BACKOFF_AFTER_FAILURES", "3"))
+DOMAIN_BACKOFF_BASE = float(os.getenv("DOMAIN_BACKOFF_BASE", "300"))
+DOMAIN_BACKOFF_MAX = float(os.getenv("DOMAIN_BACKOFF_MAX", str(24 * 3600)))
+# 기사별 추출 결과를 다른 키워드/실행에서 재사용하는 기간(초)
+ARTICLE_STORE_TTL = float(os.getenv("ARTICLE_STORE_TTL", str(3 * 24 * 3600)))
+# 언론사별 상용구 줄 학습: 이 페이지 수 이상 학습한 언론사에서 이 비율 이상이면서 최소 이 횟수 이상의 페이지에 나온 줄은 제거,
+# 언론사당 기억할 줄 수와 (같은 기사를 다시 학습하지 않도록) 기억할 학습한 기사 URL 수
+BOILERPLATE_MIN_PAGES = int(os.getenv("BOILERPLATE_MIN_PAGES", "5"))
+BOILERPLATE_LINE_RATIO = float(os.getenv("BOILERPLATE_LINE_RATIO", "0.3"))
+BOILERPLATE_MIN_COUNT = int(os.getenv("BOILERPLATE_MIN_COUNT", "5"))
+BOILERPLATE_MAX_LINES = int(os.getenv("BOILERPLATE_MAX_LINES", "5000"))
+BOILERPLATE_MAX_URLS = int(os.getenv("BOILERPLATE_MAX_URLS", "5000"))
+# 캐시 적중 1회당 절감되는 (초, 달러) 추정치. MEME_CACHE_HIT_SAVINGS='{"llm_response": [12, 0.004]}' 형식으로 덮어쓸 수 있다
+CACHE_HIT_SAVINGS = {
+    "serper_search": (1.2, 0.001),
+    "serper_image_memory": (1.0, 0.001),
+    "serper_image": (1.0, 0.001),
+    "article_fetch": (1.5, 0.0),
+    "article_html": (0.0, 0.0),
+    "llm_response": (8.0, 0.005),
+    "translation_memo": (60.0, 0.02),
+    "article_extraction": (8.0, 0.003),
+    "url_failure": (ARTICLE_CONNECT_TIMEOUT, 0.0),
+    "domain_health": (0.0, 0.0),
+    "boilerplate_lines": (0.0, 0.0),
+    "run_tape": (0.0, 0.0),
+}
+CACHE_HIT_SAVINGS.update({
+    name: tuple(value) for name, value in json.loads(os.getenv("MEME_CACHE_HIT_SAVINGS", "{}")).items()
+})
+# 카운터를 SQLite에 누적 기록하는 최소 간격(초). 종료 시에도 한 번 기록한다
+CACHE_COUNTER_FLUSH_SECONDS = float(os.getenv("CACHE_COUNTER_FLUSH_SECONDS", "30"))
+
+class PersistentCache:
+    """SQLite 기반 TTL + LRU 캐시. 같은 파일을 쓰는 모든 프로세스가 항목을 공유한다
+
+    값은 JSON으로 직렬화해 저장하고(compress=True면 zlib 압축), namespace별로 항목 수/바이트 한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거한다.
+    hits/misses 등 카운터는 프로세스 단위로 집계하고, 주기적으로 cache_counters 테이블에 누적해 프로세스 간 합계(lifetime)를 남긴다.
+    DB 오류는 캐시 미스로 처리해 파이프라인을 멈추지 않는다.
+    """
+
+    def __init__(self, namespace: str, ttl: float, max_entries: int = None, max_bytes: int = None,
+                 path: str = None, compress: bool = False):
+        self.namespace = namespace
+        self.compress = compress
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = path or MEME_CACHE_PATH
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "writes": 0, "errors": 0}
+        self._pending = {}  # 아직 cache_counters에 기록하지 않은 카운터 증가분
+        self._last_flush = time.monotonic()
+
+    def _conn(self):
+        # sqlite3 연결은 스레드 간 공유하지 않고 스레드마다 하나씩 사용
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                " created_at REAL NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL,"
+                " size INTEGER NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_lru ON cache_entries (namespace, last_access)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_counters ("
+                " namespace TEXT NOT NULL, name TEXT NOT NULL, value INTEGER NOT NULL,"
+                " PRIMARY KEY (namespace, name))"
+            )
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name: str, n: int = 1):
+        with self._lock:
+            self._counters[name] += n
+            self._pending[name] = self._pending.get(name, 0) + n
+            due = time.monotonic() - self._last_flush >= CACHE_COUNTER_FLUSH_SECONDS
+        if due:
+            self.flush_counters()
+
+    def flush_counters(self):
+        """프로세스 카운터 증가분을 cache_counters 테이블에 누적"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+        try:
+            self._conn().executemany(
+                "INSERT INTO cache_counters (namespace, name, value) VALUES (?, ?, ?)"
+                " ON CONFLICT (namespace, name) DO UPDATE SET value = value + excluded.value",
+                [(self.namespace, name, n) for name, n in pending.items()],
+            )
+        except sqlite3.Error as e:
+            # 통계용 기록이므로 실패해도 파이프라인에는 영향 없음 (errors 카운터로 재귀하지 않도록 출력만)
+            print(f"⚠️ 캐시 카운터 기록 실패 ({self.namespace}): {e}")
+
+    def get(self, key: str, count: bool = True):
+        """캐시된 값을 반환. 없거나 만료되었으면 None
+
+        count=False면 hits/misses를 세지 않는다. 값을 그대로 쓸 수 있는지 호출자가 더 판단해야 할 때 쓰고, 결과는 count_lookup()으로 기록한다.
+        """
+        now = time.time()
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                if count:
+                    self._count("misses")
+                return None
+            if row[1] <= now:
+                conn.execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self.namespace, key))
+                self._count("expired")
+                if count:
+                    self._count("misses")
+                return None
+            conn.execute(
+                "UPDATE cache_entries SET last_access = ? WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key),
+            )
+            if count:
+                self._count("hits")
+            value = row[0]
+            if isinstance(value, bytes):
+                value = zlib.decompress(value).decode("utf-8")
+            return json.loads(value)
+        except sqlite3.Error as e:
+            print(f"⚠️ 캐시 조회 실패 ({self.namespace}): {e}")
+            self._count("errors")
+            if count:
+                self._count("misses")
+            return None
+
+    def count_lookup(self, hit: bool):
+        """get(count=False)로 조회한 결과를 적중/미스로 기록"""
+        self._count("hits" if hit else "misses")
+
+    def set(self, key: str, value, ttl: float = None):
+        now = time.time()
+        data = json.dumps(value, ensure_ascii=False)
+        if self.compress:
+            data = zlib.compress(data.encode("utf-8"))
+            size = len(data)
+        else:
+            size = len(data.encode("utf-8"))
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        try:
+            conn = self._conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, created_at, expires_at, last_access, size)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, data, now, expires_at, now, size),
+            )
+            self._count("writes")
+            self._evict(conn, now)
+        except sqlite3.Error as e:
+            print(f"⚠️ 캐시 저장 실패 ({self.namespace}): {e}")
+            self._count("errors")
+
+    def delete(self, key: str):
+        try:
+            self._conn().execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self.namespace, key))
+        except sqlite3.Error as e:
+            print(f"⚠️ 캐시 삭제 실패 ({self.namespace}): {e}")
+            self._count("errors")
+
+    def _evict(self, conn, now: float):
+        if self.max_entries is None and self.max_bytes is None:
+            return
+        count, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?", (self.namespace,)
+        ).fetchone()
+        if (self.max_entries is None or count <= self.max_entries) and (self.max_bytes is None or total <= self.max_bytes):
+            return
+
+        # 만료 항목을 먼저 정리하고, 그래도 한도를 넘으면 LRU 순서로 제거
+        expired = conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?", (self.namespace, now)
+        ).rowcount
+        if expired:
+            self._count("expired", expired)
+            count, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?", (self.namespace,)
+            ).fetchone()
+
+        victims = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM cache_entries WHERE namespace = ? ORDER BY last_access ASC", (self.namespace,)
+        ):
+            if (self.max_entries is None or count <= self.max_entries) and (self.max_bytes is None or total <= self.max_bytes):
+                break
+            victims.append((self.namespace, key))
+            count -= 1
+            total -= size
+        if victims:
+            conn.executemany("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", victims)
+            self._count("evictions", len(victims))
+
+    def stats(self) -> dict:
+        """프로세스 카운터 + 저장된 항목 수/바이트/생성 시점 분포 + 모든 프로세스 누적 카운터(lifetime)"""
+        self.flush_counters()
+        with self._lock:
+            stats = dict(self._counters)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        now = time.time()
+        try:
+            conn = self._conn()
+            count, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?", (self.namespace,)
+            ).fetchone()
+            ages = [now - created_at for (created_at,) in conn.execute(
+                "SELECT created_at FROM cache_entries WHERE namespace = ?", (self.namespace,)
+            )]
+            lifetime = {name: 0 for name in self._counters}
+            lifetime.update(conn.execute(
+                "SELECT name, value FROM cache_counters WHERE namespace = ?", (self.namespace,)
+            ).fetchall())
+            stats.update(entries=count, bytes=total, age=_age_summary(ages), lifetime=lifetime)
+        except sqlite3.Error:
+            stats.update(entries=None, bytes=None, age=None, lifetime=None)
+        return stats
+
+class MemoryLRUCache:
+    """프로세스 내 LRU + TTL 캐시 (스레드 안전). 영속 캐시 앞단의 1차 캐시로 사용"""
+
+    def __init__(self, name: str, max_entries: int, ttl: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at, created_at, value)
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "writes": 0}
+
+    def get(self, key: str):
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self._counters["misses"] += 1
+                return None
+            if item[0] <= now:
+                del self._data[key]
+                self._counters["expired"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._data.move_to_end(key)
+            self._counters["hits"] += 1
+            return item[2]
+
+    def set(self, key: str, value, ttl: float = None):
+        now = time.monotonic()
+        expires_at = now + min(self.ttl, self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, now, value)
+            self._data.move_to_end(key)
+            self._counters["writes"] += 1
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            stats = dict(self._counters)
+            items = list(self._data.values())
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        stats.update(
+            entries=len(items),
+            bytes=sum(len(json.dumps(value, ensure_ascii=False).encode("utf-8")) for _, _, value in items),
+            age=_age_summary([now - created_at for _, created_at, _ in items]),
+            lifetime=None,  # 프로세스 메모리 캐시라 누적 기록 없음
+        )
+        return stats
+
+# 캐시 항목 나이 분포 구간 (라벨, 상한 초)
+_AGE_BUCKETS = [("<1m", 60), ("<10m", 600), ("<1h", 3600), ("<1d", 24 * 3600), ("<7d", 7 * 24 * 3600), (">=7d", float("inf"))]
+
+def _age_summary(ages: list) -> dict:
+    """항목 나이(초) 목록을 구간별 개수와 p50/p90/max로 요약"""
+    ages = sorted(ages)
+    buckets = {label: 0 for label, _ in _AGE_BUCKETS}
+    for age in ages:
+        for label, limit in _AGE_BUCKETS:
+            if age < limit:
+                buckets[label] += 1
+                break
+    if not ages:
+        return {"buckets": buckets, "p50": None, "p90": None, "max": None}
+    return {
+        "buckets": buckets,
+        "p50": ages[len(ages) // 2],
+        "p90": ages[min(len(ages) - 1, int(len(ages) * 0.9))],
+        "max": ages[-1],
+    }
+
+def _normalize_query(text: str) -> str:
+    """캐시 키용 검색어 정규화 (유니코드 NFC, 공백 정리, 대소문자 무시)"""
+    return " ".join(unicodedata.normalize("NFC", text or "").split()).casefold()
+
+# Serper 웹 검색 결과 캐시 (같은 키워드가 다시 트렌딩될 때 Serper 호출/쿼터 절약)
+_search_cache = PersistentCache(
+    "serper_search",
+    ttl=SERPER_SEARCH_CACHE_TTL,
+    max_entries=SERPER_SEARCH_CACHE_MAX_ENTRIES,
+    max_bytes=SERPER_SEARCH_CACHE_MAX_BYTES,
+)
+
+# 이미지 검색 결과 캐시 (키: 정규화된 키워드, 값: image_url 문자열)
+_image_memory_cache = MemoryLRUCache("serper_image_memory", SERPER_IMAGE_MEMORY_CACHE_SIZE, ttl=SERPER_IMAGE_MEMORY_CACHE_TTL)
+_image_cache = PersistentCache("serper_image", ttl=SERPER_IMAGE_CACHE_TTL, max_entries=SERPER_IMAGE_CACHE_MAX_ENTRIES)
+
+# 기사 페이지 캐시 (키: 정규화된 URL, 값: 추출한 텍스트/ETag/Last-Modified/파서 버전)
+_article_cache = PersistentCache(
+    "article_fetch",
+    ttl=ARTICLE_CACHE_TTL,
+    max_entries=ARTICLE_CACHE_MAX_ENTRIES,
+    compress=True,
+)
+# 기사 원본 HTML (키: 정규화된 URL). 파서 버전이 바뀐 뒤 304를 받았을 때 다시 파싱하는 용도라 적중 시마다 읽지 않도록 따로 저장
+_article_html_cache = PersistentCache(
+    "article_html",
+    ttl=ARTICLE_CACHE_TTL,
+    max_entries=ARTICLE_CACHE_MAX_ENTRIES,
+    max_bytes=ARTICLE_CACHE_MAX_BYTES,
+    compress=True,
+)
+
+# LLM 응답 캐시 (키: 모델 + 렌더링된 메시지 + 도구 + temperature + 프롬프트 버전의 해시)
+_llm_cache = PersistentCache("llm_response", ttl=MEME_LLM_CACHE_TTL, max_bytes=MEME_LLM_CACHE_MAX_BYTES, compress=True)
+
+# 실행별 외부 입력 기록 (키: 실행 지문 + 계층 + 입력의 해시, 값: 검색 결과/기사 본문/단계 입력). replay 모드가 LLM 응답과 함께 사용
+_run_tape = PersistentCache("run_tape", ttl=MEME_LLM_CACHE_TTL, max_bytes=MEME_LLM_CACHE_MAX_BYTES, compress=True)
+
+# 1단계(검색→추출→번역) 결과 메모 (키: keyword/why_trending 지문)
+_translation_memo = PersistentCache("translation_memo", ttl=TRANSLATION_MEMO_TTL, max_entries=2000)
+
+# 기사 추출 결과 저장소 (키: 정규화된 기사 URL, 값: extracted_content 항목 하나)
+_article_store = PersistentCache("article_extraction", ttl=ARTICLE_STORE_TTL, max_entries=20000)
+
+# 수집 실패 기록 (키: 정규화된 URL / 도메인)
+_url_failure_cache = PersistentCache("url_failure", ttl=URL_FAILURE_TTL, max_entries=50000)
+_domain_health = PersistentCache("domain_health", ttl=30 * 24 * 3600, max_entries=10000)
+
+# 언론사별 상용구 줄 통계 (키: 도메인 또는 포털 도메인/언론사, 값: 학습한 페이지 수와 줄 해시별 등장 페이지 수)
+_boilerplate_index = PersistentCache("boilerplate_lines", ttl=90 * 24 * 3600, max_entries=5000)
+
+def image_cache_stats() -> dict:
+    """이미지 검색 캐시 계층별 통계 (hit ratio 튜닝용)"""
+    memory, persistent = _image_memory_cache.stats(), _image_cache.stats()
+    # 메모리 미스 중 영속 캐시에서 찾은 비율까지 합친 전체 적중률
+    lookups = memory["hits"] + memory["misses"]
+    overall = (memory["hits"] + persistent["hits"]) / lookups if lookups else 0.0
+    return {"memory": memory, "persistent": persistent, "overall_hit_ratio": overall}
+
+# MemeAgentCrew / serper_image_search가 사용하는 모든 캐시 (통계 보고 및 종료 시 카운터 기록 대상)
+_ALL_CACHES = [
+    _search_cache, _image_memory_cache, _image_cache, _article_cache, _article_html_cache, _llm_cache,
+    _translation_memo, _article_store, _url_failure_cache, _domain_health, _boilerplate_index, _run_tape,
+]
+
+def flush_cache_counters():
+    """모든 영속 캐시의 카운터 증가분을 기록 (프로세스 종료 시 자동 호출)"""
+    for cache in _ALL_CACHES:
+        if isinstance(cache, PersistentCache):
+            cache.flush_counters()
+
+atexit.register(flush_cache_counters)
+
+def get_cache_stats() -> dict:
+    """모든 캐시의 통계를 한 번에 반환
+
+    캐시별로 hits/misses/evictions/bytes/나이 분포와, 적중 수 × CACHE_HIT_SAVINGS로 추정한 절감 시간(초)/비용(달러)을 담는다.
+    영속 캐시는 모든 프로세스 누적 카운터(lifetime) 기준, 메모리 캐시는 현재 프로세스 기준으로 절감량을 계산한다.
+    """
+    caches = {}
+    totals = {"entries": 0, "bytes": 0, "hits": 0, "misses": 0, "evictions": 0,
+              "estimated_seconds_saved": 0.0, "estimated_dollars_saved": 0.0}
+    for cache in _ALL_CACHES:
+        name = cache.namespace if isinstance(cache, PersistentCache) else cache.name
+        stats = cache.stats()
+        counters = stats.get("lifetime") or stats
+        seconds, dollars = CACHE_HIT_SAVINGS.get(name, (0.0, 0.0))
+        stats["estimated_seconds_saved"] = counters["hits"] * seconds
+        stats["estimated_dollars_saved"] = counters["hits"] * dollars
+        caches[name] = stats
+
+        totals["entries"] += stats["entries"] or 0
+        totals["bytes"] += stats["bytes"] or 0
+        for key in ("hits", "misses", "evictions"):
+            totals[key] += counters[key]
+        totals["estimated_seconds_saved"] += stats["estimated_seconds_saved"]
+        totals["estimated_dollars_saved"] += stats["estimated_dollars_saved"]
+    lookups = totals["hits"] + totals["misses"]
+    totals["hit_ratio"] = totals["hits"] / lookups if lookups else 0.0
+    return {"generated_at": datetime.now().isoformat(timespec="seconds"), "caches": caches, "totals": totals}
+
+def _format_seconds(seconds) -> str:
+    if seconds is None:
+        return "-"
+    for unit, size in (("d", 24 * 3600), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds / size:.1f}{unit}"
+    return f"{seconds:.0f}s"
+
+def print_cache_stats(stats: dict = None):
+    """get_cache_stats() 결과를 표 형태로 출력"""
+    stats = stats or get_cache_stats()
+    header = f"{'cache':<20} {'entries':>8} {'bytes':>10} {'hits':>8} {'misses':>8} {'hit%':>6} {'evict':>6} {'age p50':>8} {'age max':>8} {'saved':>8} {'saved $':>9}"
+    print(f"📊 캐시 통계 ({stats['generated_at']}, 영속 캐시는 전체 프로세스 누적)")
+    print(header)
+    print("-" * len(header))
+    rows = list(stats["caches"].items()) + [("TOTAL", stats["totals"])]
+    for name, item in rows:
+        counters = item.get("lifetime") or item
+        lookups = counters["hits"] + counters["misses"]
+        hit_pct = 100 * counters["hits"] / lookups if lookups else 0.0
+        age = item.get("age") or {}
+        print(
+            f"{name:<20} {item['entries'] if item['entries'] is not None else '-':>8} "
+            f"{item['bytes'] if item['bytes'] is not None else '-':>10} {counters['hits']:>8} {counters['misses']:>8} "
+            f"{hit_pct:>5.1f}% {counters['evictions']:>6} {_format_seconds(age.get('p50')):>8} "
+            f"{_format_seconds(age.get('max')):>8} {_format_seconds(item['estimated_seconds_saved']):>8} "
+            f"{item['estimated_dollars_saved']:>9.3f}"
+        )
+    print("\n나이 분포:")
+    for name, item in stats["caches"].items():
+        if item.get("age") and item["entries"]:
+            buckets = ", ".join(f"{label} {count}" for label, count in item["age"]["buckets"].items() if count)
+            print(f"  {name}: {buckets}")
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def _get_http_session():
+    """keep-alive 연결을 재사용하는 프로세스 공유 requests 세션 (스레드 간 공유)"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                # 연결 리셋/읽기 실패와 일시적 서버 오류만 재시도. Serper 검색은 부작용이 없으므로 POST도 재시도 허용
+                retry = Retry(
+                    total=SERPER_MAX_RETRIES,
+                    connect=SERPER_MAX_RETRIES,
+                    read=SERPER_MAX_RETRIES,
+                    status=SERPER_MAX_RETRIES,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=None,
+                    backoff_factor=0.3,
+                    raise_on_status=False,
+                )
+                # pool_block=True: 호스트당 연결 수를 SERPER_MAX_CONNECTIONS로 제한 (초과 요청은 대기)
+                adapter = HTTPAdapter(
+                    pool_connections=16,  # 연결 풀을 유지할 호스트 수 (기사 페이지는 _get_article_session 사용)
+                    pool_maxsize=SERPER_MAX_CONNECTIONS,
+                    pool_block=True,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
+_article_session = None
+_article_session_lock = threading.Lock()
+
+def _get_article_session():
+    """기사 페이지 수집 전용 프로세스 공유 requests 세션 (재시도 없음)
+
+    Serper 세션처럼 재시도하면 재시도마다 타임아웃이 처음부터 다시 적용되어 URL별 deadline을 넘기고,
+    재시도가 소진된 타임아웃은 ConnectionError로 바뀐다. 실패한 URL은 다음 실행에서 네거티브 캐시/도메인 백오프로 다룬다.
+    """
+    global _article_session
+    if _article_session is None:
+        with _article_session_lock:
+            if _article_session is None:
+                from requests.adapters import HTTPAdapter
+
+                # 도메인별 동시 요청 수는 _domain_semaphore가 제한하므로 연결 풀에서는 기다리지 않음 (pool_block=False)
+                adapter = HTTPAdapter(
+                    pool_connections=32,  # 연결 풀을 유지할 언론사 호스트 수
+                    pool_maxsize=ARTICLE_FETCH_CONCURRENCY,
+                    max_retries=0,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _article_session = session
+    return _article_session
+
+def _serper_post(endpoint: str, payload: dict) -> dict:
+    """공유 세션으로 Serper API 호출 후 JSON 응답 반환 (HTTP 오류는 예외로 전파)"""
+    headers = {'X-API-KEY': os.getenv("SERPER_API_KEY", ""), 'Content-Type': 'application/json'}
+    response = _get_http_session().post(
+        f"{SERPER_BASE_URL}/{endpoint}",
+        headers=headers,
+        data=json.dumps(payload),
+        timeout=(SERPER_CONNECT_TIMEOUT, SERPER_READ_TIMEOUT),
+    )
+    response.raise_for_status()
+    return response.json()
+
+@lru_cache(maxsize=None)
+def _pooled_serper_dev_tool_class():
+    """SerperDevTool의 API 호출부만 공유 세션(_serper_post) + 영속 캐시(_search_cache)로 교체한 서브클래스"""
+    from crewai_tools import SerperDevTool
+
+    class PooledSerperDevTool(SerperDevTool):
+        def _make_api_request(self, search_query: str, search_type: str) -> dict:
+            params = {"num": self.n_results}
+            if self.country:
+                params["gl"] = self.country
+            if self.location:
+                params["location"] = self.location
+            if self.locale:
+                params["hl"] = self.locale
+            return serper_web_search(search_query, search_type, **params)
+
+    return PooledSerperDevTool
+
+def serper_web_search(search_query: str, search_type: str = "search", num: int = 10, **params) -> dict:
+    """Serper 웹/뉴스 검색 (정규화된 검색어 기준 영속 캐시 적용). 기본값은 SerperDevTool과 동일"""
+    params["num"] = num
+    cache_key = json.dumps([search_type, _normalize_query(search_query), params], ensure_ascii=False, sort_keys=True)
+
+    def _search():
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        results = _serper_post(search_type, dict(params, q=search_query))
+        _search_cache.set(cache_key, results)
+        return results
+
+    # 실행 중이면 결과를 실행 기록에 남기고, replay 모드에서는 검색 캐시가 만료됐어도 기록된 결과를 그대로 사용
+    return _replayable("search", cache_key, _search)
+
+def _image_cache_ttl(image_url: str) -> float:
+    return SERPER_IMAGE_CACHE_NEGATIVE_TTL if image_url == "No image found" else SERPER_IMAGE_CACHE_TTL
+
 # Serper 이미지 검색 도구 (image_generator.py에서 가져옴)
-@tool("Serper Image Search")
 def serper_image_search(search_query: str) -> str:
     """Serper API를 사용해 이미지 검색 수행 후 JSON 반환"""
     api_key = os.getenv("SERPER_API_KEY")
     if not api_key:
         return json.dumps({"keyword": search_query, "image_url": "API key missing"})
 
-    url = "https://google.serper.dev/images"
-    payload = json.dumps({"q": search_query})
-    headers = {'X-API-KEY': api_key, 'Content-Type': 'application/json'}
+    # 메모리 → SQLite 순으로 캐시 조회 (SQLite 히트는 메모리로 승격)
+    cache_key = _normalize_query(search_query)
+    image_url = _image_memory_cache.get(cache_key)
+    if image_url is None:
+        image_url = _image_cache.get(cache_key)
+        if image_url is not None:
+            _image_memory_cache.set(cache_key, image_url, ttl=_image_cache_ttl(image_url))
+    if image_url is not None:
+        return json.dumps({"keyword": search_query, "image_url": image_url})
 
     try:
-        response = requests.post(url, headers=headers, data=payload)
-        response.raise_for_status()
-        results = response.json()
+        results = _serper_post("images", {"q": search_query})
         
         images = results.get('images', [])
         if images:
             image_url = images[0].get('imageUrl') or images[0].get('link') or "No image found"
-            return json.dumps({"keyword": search_query, "image_url": image_url})
         else:
-            return json.dumps({"keyword": search_query, "image_url": "No image found"})
+            image_url = "No image found"
+
+        # 검색 오류는 캐시하지 않고, 결과 없음은 짧은 TTL로 캐시
+        ttl = _image_cache_ttl(image_url)
+        _image_cache.set(cache_key, image_url, ttl=ttl)
+        _image_memory_cache.set(cache_key, image_url, ttl=ttl)
+        return json.dumps({"keyword": search_query, "image_url": image_url})
     except Exception as e:
         return json.dumps({"keyword": search_query, "image_url": f"Search error: {str(e)}"})
 
+def search_images_concurrently(keywords: list) -> dict:
+    """키워드 목록의 이미지 검색을 동시에 수행하고 입력 순서대로 {"keyword1": url, ...} 반환
+
+    동시 실행 수는 SERPER_IMAGE_CONCURRENCY로 제한되며, 한 키워드의 실패는 다른 키워드에 영향을 주지 않음
+    """
+    def _search(i, keyword):
+        try:
+            parsed_result = json.loads(serper_image_search(keyword))
+            return parsed_result.get("image_url", f"no_result_{i+1}")
+        except Exception as e:
+            print(f"이미지 검색 실패 ({keyword}): {e}")
+            return f"search_error_{i+1}"
+
+    if not keywords:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(SERPER_IMAGE_CONCURRENCY, len(keywords)))) as executor:
+        futures = [executor.submit(_search, i, keyword) for i, keyword in enumerate(keywords)]
+        return {f"keyword{i+1}": future.result() for i, future in enumerate(futures)}
+
+# 기사 페이지 수집 (ScrapeWebsiteTool 대체: URL 단위 캐시 + 조건부 재검증)
+# ScrapeWebsiteTool과 같은 브라우저 헤더 사용 (일부 언론사는 기본 UA를 차단)
+ARTICLE_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+# 파싱 방식이 바뀌면 올려서 캐시된 텍스트를 다시 만들게 함
+ARTICLE_PARSER_VERSION = 4
+
+def _html_to_text(html: str) -> str:
+    """HTML을 텍스트로 변환 (ScrapeWebsiteTool과 동일한 방식)"""
+    from bs4 import BeautifulSoup
+    parsed = BeautifulSoup(html, "html.parser")
+    text = parsed.get_text(" ")
+    text = re.sub("[ \t]+", " ", text)
+    text = re.sub("\\s+\n\\s+", "\n", text)
+    return text
+
+# 언론사별 본문/제목/날짜 셀렉터 (호스트 접미사, 언론사명, 본문, 제목, 날짜). 언론사명이 None이면 메타 태그에서 읽는다
+_NEWS_SITE_RULES = [
+    ("news.naver.com", None,
+     ["#dic_area", "#newsct_article", "#articleBodyContents"],
+     ["#title_area", "h2.media_end_head_headline", "#articleTitle"],
+     ["span.media_end_head_info_datestamp_time", "span.t11"]),
+    ("entertain.naver.com", None,
+     ["#articeBody", "div._article_content", "article#comp_news_article"],
+     ["h2.end_tit", "h2.NewsEndMain_article_title__kqEzS"],
+     ["span.author em", "em.date"]),
+    ("sports.naver.com", None,
+     ["#newsEndContents", "div._article_content"],
+     ["h4.title", "h2.NewsEndMain_article_title__kqEzS"],
+     ["div.info span"]),
+    ("v.daum.net", None,
+     ["div.article_view section", "div.article_view"],
+     ["h3.tit_view"],
+     ["span.num_date"]),
+    ("yna.co.kr", "연합뉴스",
+     ["div.story-news.article", "article.story-news", "div.article-txt"],
+     ["h1.tit", "h1.tit01"],
+     ["p.update-time", "span.txt-time"]),
+    ("chosun.com", "조선일보",
+     ["section.article-body", "div.article-body", "div#news_body_id"],
+     ["h1.article-header__headline", "h1#news_title_text_id"],
+     ["span.upDate", "div.news_date"]),
+    ("joongang.co.kr", "중앙일보",
+     ["div#article_body", "div.article_body"],
+     ["h1.headline"],
+     ["p.date time", "div.byline time"]),
+]
+# 본문 안에서도 LLM에 넘길 필요 없는 요소 (사진 설명, 기자 정보, 광고, 관련 기사, 댓글)
+_ARTICLE_NOISE_SELECTORS = (
+    "script, style, noscript, iframe, figure, figcaption, table, em.img_desc, span.end_photo_org, div.vod_player_wrap,"
+    " div.media_end_head_journalist, div.byline, div.reporter_area, div.copyright, div.ad, div[class*=advert],"
+    " div.related, div[class*=related], div[class*=comment], aside, button"
+)
+
+def _make_soup(html: str):
+    from bs4 import BeautifulSoup
+    try:
+        return BeautifulSoup(html, "lxml")
+    except Exception:
+        # lxml이 없는 환경에서는 내장 파서 사용
+        return BeautifulSoup(html, "html.parser")
+
+def _select_first(soup, selectors):
+    for selector in selectors:
+        node = soup.select_one(selector)
+        if node is not None and node.get_text(strip=True):
+            return node
+    return None
+
+def _meta_content(soup, *names):
+    for name in names:
+        node = soup.find("meta", attrs={"property": name}) or soup.find("meta", attrs={"name": name})
+        if node is not None and node.get("content", "").strip():
+            return node["content"].strip()
+    return None
+
+def _body_paragraphs(node) -> list:
+    """본문 노드에서 잡음 요소를 제거하고 문단 목록으로 변환 (<p>가 없는 포털 본문은 <br> 기준 줄 단위)"""
+    for noise in node.select(_ARTICLE_NOISE_SELECTORS):
+        noise.decompose()
+    paragraphs = [p.get_text(" ", strip=True) for p in node.find_all("p")]
+    if sum(len(p) for p in paragraphs) < 0.5 * len(node.get_text(strip=True)):
+        paragraphs = node.get_text("\n").split("\n")
+    paragraphs = [" ".join(p.split()) for p in paragraphs]
+    return [p for p in paragraphs if len(p) >= 2]
+
+def _newspaper_article(html: str, url: str):
+    """newspaper3k로 본문 추출 (설치되지 않았거나 실패하면 None)"""
+    try:
+        from newspaper import Article
+    except ImportError:
+        return None
+    try:
+        article = Article(url, language="ko")
+        article.download(input_html=html)
+        article.parse()
+    except Exception:
+        return None
+    paragraphs = [" ".join(p.split()) for p in article.text.split("\n") if p.strip()]
+    if not paragraphs:
+        return None
+    return {
+        "title": article.title or None,
+        "date": article.publish_date.isoformat() if article.publish_date else None,
+        "paragraphs": paragraphs,
+    }
+
+def _densest_block(soup):
+    """<article> 또는 직계 <p> 텍스트가 가장 많은 블록 (일반 사이트용 휴리스틱)"""
+    article = soup.find("article")
+    if article is not None and len(article.get_text(strip=True)) >= 200:
+        return article
+    best, best_len, seen = None, 0, set()
+    for p in soup.find_all("p"):
+        parent = p.parent
+        if parent is None or id(parent) in seen:
+            continue
+        seen.add(id(parent))
+        length = sum(len(child.get_text(strip=True)) for child in parent.find_all("p", recursive=False))
+        if length > best_len:
+            best, best_len = parent, length
+    return best if best_len >= 200 else None
+
+def extract_news_article(html: str, url: str) -> dict:
+    """기사 HTML에서 제목/날짜/언론사/본문 문단만 추출
+
+    네이버/다음/연합뉴스/조선일보/중앙일보는 전용 셀렉터를 쓰고, 그 외 사이트는 newspaper3k → <p> 밀도 휴리스틱 → 전체 텍스트 순으로 시도한다.
+    반환: {"title", "date", "outlet", "paragraphs", "extractor"}
+    """
+    soup = _make_soup(html)
+    host = (urlsplit(url).hostname or "").lower()
+    title = _meta_content(soup, "og:title", "twitter:title") or (soup.title.get_text(strip=True) if soup.title else None)
+    date = _meta_content(soup, "article:published_time", "og:article:published_time", "pubdate")
+    outlet = _meta_content(soup, "og:article:author", "og:site_name")
+
+    for suffix, site_outlet, body_selectors, title_selectors, date_selectors in _NEWS_SITE_RULES:
+        if host != suffix and not host.endswith("." + suffix):
+            continue
+        body = _select_first(soup, body_selectors)
+        if body is None:
+            break
+        title_node = _select_first(soup, title_selectors)
+        date_node = _select_first(soup, date_selectors)
+        if date_node is not None:
+            # 네이버는 data-date-time 속성에 ISO 형식 날짜를 둔다
+            date = date_node.get("data-date-time") or date_node.get("datetime") or date_node.get_text(" ", strip=True)
+        return {
+            "title": title_node.get_text(" ", strip=True) if title_node is not None else title,
+            "date": date,
+            "outlet": site_outlet or outlet,
+            "paragraphs": _body_paragraphs(body),
+            "extractor": suffix,
+        }
+
+    article = _newspaper_article(html, url)
+    if article:
+        return {
+            "title": article["title"] or title,
+            "date": article["date"] or date,
+            "outlet": outlet,
+            "paragraphs": article["paragraphs"],
+            "extractor": "newspaper",
+        }
+    block = _densest_block(soup)
+    if block is not None:
+        return {"title": title, "date": date, "outlet": outlet, "paragraphs": _body_paragraphs(block), "extractor": "density"}
+    return {
+        "title": title, "date": date, "outlet": outlet,
+        "paragraphs": [line for line in _html_to_text(html).split("\n") if line.strip()],
+        "extractor": "fulltext",
+    }
+
+def _format_article(article: dict) -> str:
+    """추출 결과를 추출 에이전트에 넘길 짧은 텍스트로 변환"""
+    header = [
+        f"{label}: {article[key]}"
+        for label, key in (("Title", "title"), ("Date", "date"), ("Outlet", "outlet"))
+        if article.get(key)
+    ]
+    return "\n".join(header) + "\n\n" + "\n".join(article["paragraphs"])
+
+class _RepetitionGuard:
+    """수신 중인 페이지에서 1~3글자 패턴의 비정상적인 연속 반복을 감지
+
+    청크 경계에 걸친 반복도 잡도록 직전 텍스트 끝부분을 이어 붙여 검사한다.
+    인코딩을 잘못 짚었을 때 생기는 U+FFFD와 공백만으로 된 반복은 무시한다.
+    """
+
+    def __init__(self, encoding: str, limit: int = None):
+        self._limit = limit or ARTICLE_ABORT_REPEAT_CHARS
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        # 패턴 길이별로 최대 반복 구간을 한 번씩만 훑는다(finditer가 매치한 구간을 건너뛰므로 선형 시간).
+        # 첫 글자가 실제 문자인 회전만 보면 충분
+        self._patterns = [re.compile(r"((?=[^\s\ufffd])[\s\S]{%d})\1+" % n) for n in (1, 2, 3)]
+        self._tail = ""
+        self._keep = self._limit + 3
+
+    def feed(self, chunk: bytes):
+        """반복이 감지되면 (패턴, 길이), 아니면 None"""
+        window = self._tail + self._decoder.decode(chunk)
+        for pattern in self._patterns:
+            for match in pattern.finditer(window):
+                if match.end() - match.start() >= self._limit:
+                    return match.group(1), match.end() - match.start()
+        self._tail = window[-self._keep:]
+        return None
+
+def _read_limited(response, url: str, deadline: float = None) -> bytes:
+    """응답 본문을 청크 단위로 읽으며 ARTICLE_MAX_BYTES에서 자르고, 반복 페이지나 deadline(monotonic) 초과 시 즉시 연결을 끊고 예외 발생"""
+    # charset 미지정(또는 믿을 수 없는 기본값)이면 한국 언론사 대부분이 쓰는 UTF-8로 가정 (반복 감지 용도일 뿐)
+    encoding = header_charset(response.headers)
+    guard = _RepetitionGuard(encoding if encoding and encoding not in UNTRUSTED_CHARSETS else "utf-8")
+
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=16 * 1024):
+        chunk = chunk[:ARTICLE_MAX_BYTES - len(body)]
+        body.extend(chunk)
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError(f"Deadline exceeded after {len(body)} bytes")
+        repeated = guard.feed(chunk)
+        if repeated:
+            raise RuntimeError(
+                f"Aborted degenerate page after {len(body)} bytes: {repeated[0]!r} repeated over {repeated[1]} chars"
+            )
+        if len(body) >= ARTICLE_MAX_BYTES:
+            print(f"✂️ 기사 페이지가 {ARTICLE_MAX_BYTES} 바이트를 넘어 앞부분만 사용: {url}")
+            break
+    return bytes(body)
+
+def _fetch_url(url: str, cached: dict = None, deadline: float = None):
+    """GET 요청. 캐시 항목이 있으면 ETag/Last-Modified로 조건부 요청 (304면 html은 None)
+
+    본문은 스트리밍으로 읽어 ARTICLE_MAX_BYTES를 넘기지 않고, 반복 문자로 채워진 페이지는 도중에 연결을 끊는다.
+    """
+    headers = dict(ARTICLE_REQUEST_HEADERS)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    connect_timeout, read_timeout = ARTICLE_CONNECT_TIMEOUT, ARTICLE_READ_TIMEOUT
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Deadline exceeded before request")
+        connect_timeout, read_timeout = min(connect_timeout, remaining), min(read_timeout, remaining)
+    try:
+        response = _get_article_session().get(url, headers=headers, timeout=(connect_timeout, read_timeout), stream=True)
+        # 중간에 읽기를 멈추면 연결이 풀로 돌아가지 않으므로 항상 닫는다
+        with response:
+            if response.status_code == 304 and cached:
+                return 304, None, response.headers
+            response.raise_for_status()
+            body = _read_limited(response, url, deadline)
+    except requests.RequestException as e:
+        # deadline이 지나서 난 오류는 사이트 장애가 아니라 우리 쪽 시간 제한. 수신 도중의 읽기 타임아웃은
+        # ConnectionError로 나오므로 예외 종류가 아니라 시각으로 판단한다 (HTTP 상태 오류는 사이트 응답이므로 제외)
+        if deadline is not None and not isinstance(e, requests.HTTPError) and time.monotonic() >= deadline:
+            raise TimeoutError(f"Deadline exceeded: {e}") from e
+        raise
+    text, _, _ = decode_html(body, response.headers)
+    return response.status_code, text, response.headers
+
+def _url_domain(url: str) -> str:
+    return urlsplit(canonicalize_url(url)).hostname or ""
+
+def get_url_block_reason(url: str):
+    """최근 실패한 URL이거나 도메인이 백오프 중이면 사유 문자열, 아니면 None"""
+    failure = _url_failure_cache.get(canonicalize_url(url))
+    if failure:
+        return f"failed {failure['failures']} time(s): {failure['reason']}"
+    domain = _url_domain(url)
+    health = _domain_health.get(domain) if domain else None
+    if health and health.get("backoff_until", 0) > time.time():
+        return f"domain {domain} backing off after {health['consecutive_failures']} consecutive failures"
+    return None
+
+_fetch_health_lock = threading.Lock()
+
+def record_fetch_result(url: str, error: Exception = None):
+    """기사 수집 성공/실패를 URL 네거티브 캐시와 도메인별 실패율에 반영"""
+    now = time.time()
+    domain = _url_domain(url)
+    # 같은 도메인을 동시에 수집하는 스레드들의 시도/실패 횟수가 읽고-고쳐-쓰는 사이에 사라지지 않도록 잠금
+    with _fetch_health_lock:
+        health = (_domain_health.get(domain) if domain else None) or {
+            "attempts": 0, "failures": 0, "consecutive_failures": 0, "backoff_until": 0,
+        }
+        health["attempts"] += 1
+
+        if error is None:
+            health["consecutive_failures"] = 0
+            health["backoff_until"] = 0
+        else:
+            cache_key = canonicalize_url(url)
+            failure = _url_failure_cache.get(cache_key) or {"url": url, "failures": 0}
+            failure.update(failures=failure["failures"] + 1, reason=str(error)[:200], last_failure=now)
+            _url_failure_cache.set(cache_key, failure,
+                                   ttl=min(URL_FAILURE_TTL * 2 ** (failure["failures"] - 1), URL_FAILURE_MAX_TTL))
+
+            health["failures"] += 1
+            health["consecutive_failures"] += 1
+            # 연속 실패가 기준을 넘으면 도메인 전체를 지수적으로 늘어나는 기간 동안 건너뜀
+            over = health["consecutive_failures"] - DOMAIN_BACKOFF_AFTER_FAILURES
+            if over >= 0:
+                health["backoff_until"] = now + min(DOMAIN_BACKOFF_BASE * 2 ** over, DOMAIN_BACKOFF_MAX)
+
+        health["failure_rate"] = health["failures"] / health["attempts"]
+        if domain:
+            _domain_health.set(domain, health)
+
+_boilerplate_lock = threading.Lock()
+
+def _line_hash(line: str) -> str:
+    """상용구 비교용 줄 해시 (숫자는 0으로 바꿔 날짜/시각/기사번호만 다른 바이라인도 같은 줄로 취급)"""
+    normalized = re.sub(r"\d", "0", " ".join(unicodedata.normalize("NFC", line).split()))
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+_PORTAL_DOMAINS = ("naver.com", "daum.net")
+
+def _boilerplate_key(url: str, outlet: str = None):
+    """상용구 인덱스 키. 여러 언론사 기사가 섞이는 포털(네이버/다음)은 언론사 단위로 나눈다
+
+    네이버는 기사 경로/쿼리의 oid, 다음은 cp 쿼리를 쓰고, 없으면 추출한 언론사명을 쓴다. 언론사를 알 수 없는 포털 페이지는 None.
+    """
+    domain = _url_domain(url)
+    if not domain or not any(domain == portal or domain.endswith("." + portal) for portal in _PORTAL_DOMAINS):
+        return domain or None
+    query = dict(parse_qsl(urlsplit(url).query))
+    if domain.endswith("naver.com"):
+        match = NAVER_ARTICLE_PATH.match(urlsplit(canonicalize_url(url)).path)
+        source = match.group(1) if match else query.get("oid")
+    else:
+        source = query.get("cp")
+    source = source or outlet
+    return f"{domain}/{source}" if source else None
+
+def strip_boilerplate(url: str, paragraphs: list, learn: bool = True, outlet: str = None) -> list:
+    """언론사에서 반복적으로 나오는 줄(기자 바이라인, 저작권 문구, 구독 안내, 메뉴 등)을 제거
+
+    learn=True면 이 페이지의 줄들을 언론사 인덱스에 먼저 반영한다(새로 내려받은 페이지에만 사용).
+    같은 기사(정규화 URL)는 처음 한 번만 학습하므로, 인기 기사를 여러 번 다시 내려받아도 그 본문 문단이 상용구로 쌓이지 않는다.
+    BOILERPLATE_MIN_PAGES 이상 학습한 뒤, max(BOILERPLATE_MIN_COUNT, 페이지 수 × BOILERPLATE_LINE_RATIO) 이상의
+    페이지에 나온 줄을 제거한다(같은 사건을 다룬 몇 건에 공통으로 실린 통신 기사 문단은 남도록). 모든 줄이 지워지면 원래 문단을 돌려준다.
+    """
+    key = _boilerplate_key(url, outlet)
+    if not key or not paragraphs:
+        return paragraphs
+    hashes = [_line_hash(paragraph) for paragraph in paragraphs]
+    url_hash = hashlib.sha1(canonicalize_url(url).encode("utf-8")).hexdigest()[:12]
+    with _boilerplate_lock:
+        index = _boilerplate_index.get(key) or {"pages": 0, "counts": {}}
+        learned = index.setdefault("urls", [])
+        if learn and url_hash not in learned:
+            counts = index["counts"]
+            for line_hash in set(hashes):
+                counts[line_hash] = counts.get(line_hash, 0) + 1
+            index["pages"] += 1
+            if len(counts) > BOILERPLATE_MAX_LINES:
+                # 한도를 넘으면 적게 나온 줄부터 잊음 (상용구는 자주 나오므로 남는다)
+                keep = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:BOILERPLATE_MAX_LINES // 2]
+                index["counts"] = dict(keep)
+            learned.append(url_hash)
+            # 오래전에 학습한 URL부터 잊음 (그만큼 페이지 수가 쌓인 뒤라 한 번 더 학습돼도 임계값에 닿지 않는다)
+            index["urls"] = learned[-BOILERPLATE_MAX_URLS:]
+            _boilerplate_index.set(key, index)
+
+    if index["pages"] < BOILERPLATE_MIN_PAGES:
+        return paragraphs
+    threshold = max(BOILERPLATE_MIN_COUNT, index["pages"] * BOILERPLATE_LINE_RATIO)
+    kept = [
+        paragraph for paragraph, line_hash in zip(paragraphs, hashes)
+        if index["counts"].get(line_hash, 0) < threshold
+    ]
+    return kept or paragraphs
+
+def _article_text(html: str, url: str, learn: bool) -> str:
+    article = extract_news_article(html, url)
+    article["paragraphs"] = strip_boilerplate(url, article["paragraphs"], learn=learn, outlet=article.get("outlet"))
+    return _format_article(article)
+
+def fetch_article_text(url: str, deadline: float = None) -> str:
+    """기사 URL의 본문 텍스트 반환 (extract_news_article로 제목/날짜/언론사/본문 문단만 남긴 형태)
+
+    정규화된 URL로 캐시를 조회해 ARTICLE_CACHE_FRESH_SECONDS 이내면 그대로 사용하고(캐시 적중),
+    그 이후에는 조건부 GET으로 재검증해 변경이 없으면(304) 저장된 텍스트를 재사용한다(네트워크 요청이 있으므로 미스로 센다).
+    deadline(time.monotonic 기준)을 넘기면 수신 도중이라도 중단하고 TimeoutError를 낸다.
+    """
+    cache_key = canonicalize_url(url)
+    cached = _article_cache.get(cache_key, count=False)
+    now = time.time()
+    fresh = cached and cached.get("parser") == ARTICLE_PARSER_VERSION and now - cached["fetched_at"] < ARTICLE_CACHE_FRESH_SECONDS
+    _article_cache.count_lookup(hit=bool(fresh))
+    if fresh:
+        return cached["text"]
+    html = None
+    if cached and cached.get("parser") != ARTICLE_PARSER_VERSION:
+        # 파서가 바뀐 항목은 304를 받아도 다시 파싱해야 하므로, 원본 HTML이 남아 있을 때만 조건부 요청
+        html = cached.get("html") or _article_html_cache.get(cache_key)
+        if html is None:
+            cached = None
+
+    blocked = get_url_block_reason(url)
+    if blocked:
+        raise RuntimeError(f"Skipped known-failing URL ({blocked})")
+    try:
+        status, fetched_html, headers = _fetch_url(url, cached, deadline)
+    except requests.RequestException as e:
+        # 사이트의 네트워크/HTTP 오류만 실패로 기록 (deadline 초과, 반복 페이지 중단 같은 우리 쪽 중단은 제외)
+        record_fetch_result(url, e)
+        raise
+    record_fetch_result(url)
+
+    if status == 304:
+        # 예전 형식 항목에 들어 있던 html은 떼어 냄
+        entry = {key: value for key, value in cached.items() if key != "html"}
+        entry["fetched_at"] = now
+        if entry.get("parser") != ARTICLE_PARSER_VERSION:
+            entry.update(text=_article_text(html, url, learn=False), parser=ARTICLE_PARSER_VERSION)
+    else:
+        _article_html_cache.set(cache_key, fetched_html)
+        entry = {
+            "url": url,
+            "text": _article_text(fetched_html, url, learn=True),
+            "parser": ARTICLE_PARSER_VERSION,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": now,
+        }
+    _article_cache.set(cache_key, entry)
+    return entry["text"]
+
+_domain_semaphores = {}
+_domain_semaphores_lock = threading.Lock()
+
+def _domain_semaphore(domain: str) -> threading.Semaphore:
+    """도메인별 동시 요청 수 제한 (프로세스 전역, 여러 파이프라인이 같은 언론사에 몰리지 않도록)"""
+    with _domain_semaphores_lock:
+        semaphore = _domain_semaphores.get(domain)
+        if semaphore is None:
+            semaphore = _domain_semaphores[domain] = threading.Semaphore(ARTICLE_DOMAIN_CONCURRENCY)
+        return semaphore
+
+def _fetch_article_with_deadline(url: str, started: dict) -> tuple:
+    semaphore = _domain_semaphore(_url_domain(url))
+    # 도메인 슬롯 대기는 별도 제한 시간을 두고, URL 제한 시간은 슬롯을 얻은 뒤부터 계산
+    if not semaphore.acquire(timeout=ARTICLE_URL_DEADLINE):
+        raise TimeoutError("Timed out waiting for a per-domain connection slot")
+    try:
+        started[url] = time.monotonic()
+        text = fetch_article_text(url, deadline=started[url] + ARTICLE_URL_DEADLINE)
+    finally:
+        semaphore.release()
+    return text, check_content_quality(text)
+
+def fetch_articles_concurrently(urls: list, want: int = None) -> dict:
+    """기사 URL들을 동시에 수집하고 품질 필터를 통과한 본문만 반환
+
+    URL마다 도메인 슬롯을 얻은 뒤 ARTICLE_URL_DEADLINE 안에 끝나지 않으면 결과를 기다리지 않고(수신 중인 요청은 스스로 중단됨),
+    통과한 기사가 want개 모이면 남은 URL을 취소하고 바로 반환한다.
+    반환: {"articles": {url: 본문}, "failed": {url: 사유}, "stats": {...}}
+    """
+    start = time.perf_counter()
+    articles, failed, started = {}, {}, {}
+    if not urls:
+        return {"articles": articles, "failed": failed, "stats": {"requested": 0}}
+    executor = ThreadPoolExecutor(max_workers=min(ARTICLE_FETCH_CONCURRENCY, len(urls)))
+    futures = {executor.submit(_fetch_article_with_deadline, url, started): url for url in urls}
+    pending = set(futures)
+    rejected = timed_out = 0
+    try:
+        while pending and (want is None or len(articles) < want):
+            now = time.monotonic()
+            for future in [f for f in pending if not f.done() and futures[f] in started]:
+                if now - started[futures[future]] > ARTICLE_URL_DEADLINE:
+                    pending.discard(future)
+                    failed[futures[future]] = "deadline exceeded"
+                    timed_out += 1
+            if not pending:
+                break
+            # 가장 먼저 제한 시간에 도달하는 URL까지만 대기 (아직 시작 전인 URL만 남았으면 짧게 대기)
+            expiries = [started[futures[f]] + ARTICLE_URL_DEADLINE - now for f in pending if futures[f] in started]
+            timeout = max(0.05, min(expiries)) if expiries else 0.5
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                url = futures[future]
+                try:
+                    text, verdict = future.result()
+                except Exception as e:
+                    failed[url] = str(e)
+                    if isinstance(e, TimeoutError):
+                        timed_out += 1
+                    continue
+                if verdict["ok"]:
+                    articles[url] = text
+                else:
+                    rejected += 1
+                    failed[url] = f"quality checks failed ({', '.join(verdict['reasons'])})"
+    finally:
+        # 시작하지 않은 URL은 취소하고, 진행 중인 요청은 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    stats = {
+        "requested": len(urls),
+        "fetched": len(articles),
+        "rejected": rejected,
+        "failed": len(failed) - rejected,
+        "timed_out": timed_out,
+        "abandoned": len(pending),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+    return {"articles": articles, "failed": failed, "stats": stats}
+
+@lru_cache(maxsize=None)
+def _cached_scrape_website_tool_class():
+    """ScrapeWebsiteTool의 페이지 수집을 fetch_article_text(캐시 + 조건부 재검증)로 교체한 서브클래스"""
+    from crewai_tools import ScrapeWebsiteTool
+
+    class CachedScrapeWebsiteTool(ScrapeWebsiteTool):
+        def _run(self, **kwargs):
+            website_url = kwargs.get("website_url", self.website_url)
+            # 도구 결과는 LLM 메시지에 들어가므로 실행 기록에 남겨 replay 모드에서 같은 본문을 돌려줌
+            return _replayable("scrape", canonicalize_url(website_url), lambda: self._scrape(website_url))
+
+        def _scrape(self, website_url: str) -> str:
+            try:
+                text = fetch_article_text(website_url)
+            except Exception as e:
+                return f"Failed to fetch {website_url}: {e}"
+            # 품질 필터에 걸린 본문은 LLM에 넘기지 않고 건너뛰라는 메시지만 반환
+            verdict = check_content_quality(text)
+            if not verdict["ok"]:
+                print(f"🚫 품질 필터 제외: {website_url} ({', '.join(verdict['reasons'])})")
+                return f"Skipped {website_url}: content failed quality checks ({', '.join(verdict['reasons'])})"
+            return text
+
+    return CachedScrapeWebsiteTool
+
+def _normalize_trend_text(text: str) -> str:
+    """문장부호/공백/대소문자 차이만 있는 입력을 같게 취급하기 위한 정규화"""
+    return " ".join(re.sub(r"[^\w\s]", " ", _normalize_query(text)).split())
+
+def _translation_memo_key(keyword: str, why_trending: str) -> str:
+    # 프롬프트 버전을 올리면 번역 메모도 함께 무효화 (번역 결과가 이전 프롬프트로 만든 값이므로)
+    fingerprint = f"{MEME_LLM_PROMPT_VERSION}\x1f{_normalize_trend_text(keyword)}\x1f{_normalize_trend_text(why_trending)}"
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+def _llm_cache_key(model: str, messages, tools, temperature) -> str:
+    fingerprint = json.dumps(
+        [MEME_LLM_PROMPT_VERSION, model, messages, tools, temperature],
+        ensure_ascii=False, sort_keys=True, default=str,
+    )
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+# 진행 중인 run_satire_generation의 실행 기록기 (StageGraph가 단계 스레드로 전달)
+_current_run = contextvars.ContextVar("meme_current_run", default=None)
+
+class RunRecorder:
+    """run_satire_generation 한 번의 외부 입력을 LLM 응답과 함께 기록하고, replay 모드에서 기록된 값만 돌려주는 기록기
+
+    LLM 캐시 키에는 검색 결과와 수집한 기사 본문이 들어가므로, 검색 캐시가 만료되거나 상용구 학습으로 본문이 바뀌면
+    replay가 첫 LLM 호출부터 미스난다. on/refresh 모드에서는 검색/기사/이미지 결과와 단계 입력을 실행(keyword/why_trending) 단위로
+    _run_tape에 기록하고, replay 모드에서는 네트워크와 다른 캐시를 건드리지 않고 기록된 값을 돌려준다(없으면 에러).
+    """
+
+    def __init__(self, keyword: str, why_trending: str):
+        fingerprint = f"{MEME_LLM_PROMPT_VERSION}\x1f{_normalize_trend_text(keyword)}\x1f{_normalize_trend_text(why_trending)}"
+        self.run_id = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+        self._llm_seconds = {}  # 모델별 실제 호출(캐시 미스) 소요 시간 목록
+        self._lock = threading.Lock()
+
+    def record_llm_call(self, model: str, seconds: float):
+        with self._lock:
+            self._llm_seconds.setdefault(model, []).append(seconds)
+
+    def llm_call_seconds(self, model: str) -> list:
+        with self._lock:
+            return list(self._llm_seconds.get(model, []))
+
+    def llm_seconds_saved(self, model: str, calls: int, assumed_seconds: float) -> dict:
+        """model 호출을 calls회 생략해 아낀 시간. 이번 실행에서 잰 model 호출 평균 기준이고, 잰 호출이 없으면 assumed_seconds를 가정치로 표시"""
+        measured = self.llm_call_seconds(model)
+        per_call = sum(measured) / len(measured) if measured else assumed_seconds
+        return {
+            "llm_calls_saved": calls,
+            "seconds_per_call": round(per_call, 3),
+            "calls_measured": len(measured),
+            "seconds_saved": round(calls * per_call, 3),
+            "seconds_saved_basis": "measured" if measured else "assumed",
+        }
+
+    def replayable(self, layer: str, key, compute):
+        """layer(검색/기사 등)의 key 입력에 대한 compute() 결과를 기록 (replay 모드면 기록된 결과나 예외를 재생)"""
+        tape_key = hashlib.sha256(json.dumps([self.run_id, layer, key], ensure_ascii=False).encode("utf-8")).hexdigest()
+        if MEME_LLM_CACHE_MODE == "replay":
+            recorded = _run_tape.get(tape_key)
+            if recorded is None:
+                raise RuntimeError(f"Replay tape miss for {layer} {str(key)[:100]!r} (MEME_LLM_CACHE_MODE=replay)")
+            if "error" in recorded:
+                raise RuntimeError(recorded["error"])
+            return recorded["value"]
+        try:
+            value = compute()
+        except Exception as e:
+            if MEME_LLM_CACHE_MODE != "off":
+                _run_tape.set(tape_key, {"error": f"{type(e).__name__}: {e}"})
+            raise
+        if MEME_LLM_CACHE_MODE != "off":
+            _run_tape.set(tape_key, {"value": value})
+        return value
+
+def _replayable(layer: str, key, compute):
+    """실행 중이면 현재 실행 기록기로 기록/재생하고, 실행 밖(워밍업 등)이면 compute()를 그대로 실행"""
+    run = _current_run.get()
+    return compute() if run is None else run.replayable(layer, key, compute)
+
+def _make_cached_llm_class(base):
+    """base.call 결과를 _llm_cache에 저장/재사용하는 서브클래스 생성 (MEME_LLM_CACHE_MODE 참고)"""
+
+    class CachedLLM(base):
+        def call(self, messages, tools=None, *args, **kwargs):
+            if MEME_LLM_CACHE_MODE == "off":
+                return self._timed_call(messages, tools, *args, **kwargs)
+
+            # 도구 실행 결과는 이전 턴의 메시지로 포함되므로 messages에 함께 반영됨
+            cache_key = _llm_cache_key(self.model, messages, tools, getattr(self, "temperature", None))
+            if MEME_LLM_CACHE_MODE != "refresh":
+                cached = _llm_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+                if MEME_LLM_CACHE_MODE == "replay":
+                    raise RuntimeError(f"LLM replay cache miss for {self.model} (MEME_LLM_CACHE_MODE=replay)")
+
+            result = self._timed_call(messages, tools, *args, **kwargs)
+            if isinstance(result, str) and result:
+                _llm_cache.set(cache_key, result)
+            return result
+
+        def _timed_call(self, messages, tools, *args, **kwargs):
+            """실제 모델 호출. 소요 시간을 현재 실행 기록기에 남김 (절감량 보고용)"""
+            start = time.perf_counter()
+            try:
+                return super().call(messages, tools, *args, **kwargs)
+            finally:
+                run = _current_run.get()
+                if run is not None:
+                    run.record_llm_call(self.model, time.perf_counter() - start)
+
+    return CachedLLM
+
+@lru_cache(maxsize=None)
+def _cached_llm_class():
+    """LLM.call 결과를 _llm_cache에 저장/재사용하는 crewai LLM 서브클래스"""
+    from crewai import LLM
+    return _make_cached_llm_class(LLM)
+
+def _build_cached_llm(model: str, api_key: str):
+    """CachedLLM 인스턴스 생성
+
+    crewai 1.x처럼 LLM() 생성 시 모델별 네이티브 provider 객체를 돌려주는 버전에서는 call 오버라이드가 적용되지 않아
+    캐시가 조용히 꺼지므로, 서브클래스가 아닌 객체가 나오면 바로 실패시킨다.
+    """
+    cached_llm_class = _cached_llm_class()
+    llm = cached_llm_class(api_key=api_key, model=model)
+    if type(llm) is not cached_llm_class and MEME_LLM_CACHE_MODE != "off":
+        raise RuntimeError(
+            f"crewai returned {type(llm).__module__}.{type(llm).__name__} for {model} instead of CachedLLM, "
+            "so LLM responses would bypass the cache; install the crewai version pinned in pyproject.toml "
+            "or set MEME_LLM_CACHE_MODE=off"
+        )
+    return llm
+
+def _parse_json_output(text: str):
+    """LLM 출력에서 JSON 객체 추출 (```json 코드펜스나 앞뒤 설명 허용). 실패 시 None"""
+    match = re.search(r"\{.*\}", text or "", re.S)
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(0))
+    except ValueError:
+        return None
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 쓰는 입력 토큰 추정치 (ASCII는 4글자당 1, 한글 등 그 외 문자는 글자당 1 토큰으로 보수적으로 계산)"""
+    text = text or ""
+    ascii_chars = sum(1 for ch in text if ch < "\x80")
+    return (ascii_chars + 3) // 4 + len(text) - ascii_chars
+
+_WORD_RE = re.compile(r"\w{2,}")
+
+def _sentence_words(sentence: str) -> set:
+    return set(word.casefold() for word in _WORD_RE.findall(sentence))
+
+def trim_extraction_for_budget(raw: str, budget: int = None) -> tuple:
+    """추출 결과 JSON의 기사 본문(content)을 토큰 예산에 맞게 줄인다
+
+    기사마다 앞 TRANSLATION_LEAD_SENTENCES 문장을 먼저 남기고(모든 기사의 첫 문장부터 번갈아),
+    남은 예산은 희귀한 단어(IDF)와 숫자가 많은 문장 순으로 채운다. 이미 남긴 문장과 단어가 많이 겹치는 문장은 버린다.
+    JSON이 아니거나 예산이 0이면 원문을 그대로 돌려준다. 반환: (번역 단계에 넘길 문자열, 통계 dict)
+    """
+    budget = TRANSLATION_TOKEN_BUDGET if budget is None else budget
+    tokens_before = estimate_tokens(raw)
+    parsed = _parse_json_output(raw)
+    articles = parsed.get("extracted_content") if isinstance(parsed, dict) else None
+    if budget <= 0 or not isinstance(articles, list) or tokens_before <= budget:
+        return raw, {"tokens_before": tokens_before, "tokens_after": tokens_before, "tokens_saved": 0, "trimmed": False}
+
+    articles = [dict(article) for article in articles if isinstance(article, dict)]
+    sentences = []  # (기사 번호, 문장 번호, 문장, 단어 집합)
+    for index, article in enumerate(articles):
+        parts = [" ".join(part.split()) for part in SENTENCE_SPLIT_RE.split(str(article.get("content") or ""))]
+        for position, sentence in enumerate(part for part in parts if part):
+            sentences.append((index, position, sentence, _sentence_words(sentence)))
+        article["content"] = ""
+        article.pop("content_length", None)
+
+    # content를 비운 나머지 필드(제목/URL/요점 등)가 예산을 넘으면 뒤쪽 기사부터 제외 (최소 1건은 유지)
+    while len(articles) > 1 and estimate_tokens(json.dumps({"extracted_content": articles}, ensure_ascii=False)) > budget:
+        articles.pop()
+        sentences = [item for item in sentences if item[0] < len(articles)]
+    remaining = budget - estimate_tokens(json.dumps({"extracted_content": articles}, ensure_ascii=False, indent=2))
+
+    document_frequency = Counter(word for *_, words in sentences for word in words)
+    total = len(sentences) or 1
+
+    def information(item):
+        _, _, sentence, words = item
+        if not words:
+            return 0.0
+        score = sum(math.log(total / document_frequency[word]) for word in words)
+        return (score + 2 * len(re.findall(r"\d+", sentence))) / math.sqrt(len(words))
+
+    leads = sorted((item for item in sentences if item[1] < TRANSLATION_LEAD_SENTENCES), key=lambda item: (item[1], item[0]))
+    others = sorted((item for item in sentences if item[1] >= TRANSLATION_LEAD_SENTENCES), key=information, reverse=True)
+
+    kept, kept_words, dropped_overlap = [], [], 0
+    for item in leads + others:
+        words = item[3]
+        if any(len(words & other) / len(words | other) >= TRANSLATION_OVERLAP_THRESHOLD for other in kept_words if words | other):
+            dropped_overlap += 1
+            continue
+        cost = estimate_tokens(item[2]) + 1
+        if cost > remaining:
+            continue
+        remaining -= cost
+        kept.append(item)
+        kept_words.append(words)
+
+    for index, position, sentence, _ in sorted(kept, key=lambda item: (item[0], item[1])):
+        articles[index]["content"] = (articles[index]["content"] + " " + sentence).strip()
+    context = json.dumps({"extracted_content": articles}, ensure_ascii=False, indent=2)
+    tokens_after = estimate_tokens(context)
+    return context, {
+        "tokens_before": tokens_before,
+        "tokens_after": tokens_after,
+        "tokens_saved": max(0, tokens_before - tokens_after),
+        "trimmed": True,
+        "sentences_kept": len(kept),
+        "sentences_total": len(sentences),
+        "dropped_overlap": dropped_overlap,
+    }
+
+class StageGraph:
+    """의존 관계가 있는 단계들을 스레드 풀에서 실행하는 스케줄러
+
+    선행 단계가 모두 끝난 단계부터 동시에 실행하며, 각 단계 함수는 지금까지의 결과 dict를 인자로 받는다.
+    실행 중인 단계 안에서 add_stage()로 새 단계를 추가할 수 있다 (실행 결과에 따라 정해지는 단계용).
+    단계별 시작/종료 시각은 timings에, 가장 늦게 끝난 단계까지의 의존 경로는 critical_path()로 확인할 수 있다.
+    """
+
+    def __init__(self, max_workers: int = MEME_STAGE_CONCURRENCY):
+        self.max_workers = max(1, max_workers)
+        self.results = {}
+        self.timings = {}
+        self._stages = {}
+        self._lock = threading.Lock()
+        self._started_at = None
+
+    def add_stage(self, name: str, fn, deps=()):
+        with self._lock:
+            if name in self._stages:
+                raise ValueError(f"Stage '{name}' already exists")
+            self._stages[name] = (fn, tuple(deps))
+
+    def _run_stage(self, name, fn):
+        start = time.perf_counter()
+        try:
+            return fn(self.results)
+        finally:
+            end = time.perf_counter()
+            self.timings[name] = {
+                "start": round(start - self._started_at, 3),
+                "end": round(end - self._started_at, 3),
+                "seconds": round(end - start, 3),
+            }
+
+    def run(self) -> dict:
+        self._started_at = time.perf_counter()
+        done, running = set(), {}
+        error = None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                with self._lock:
+                    stages = dict(self._stages)
+                for name, (fn, deps) in stages.items():
+                    if error is None and name not in done and name not in running.values():
+                        missing = [d for d in deps if d not in stages]
+                        if missing:
+                            raise ValueError(f"Stage '{name}' depends on unknown stage(s): {missing}")
+                        if all(d in done for d in deps):
+                            # 실행 기록기(_current_run) 같은 컨텍스트 변수를 단계 스레드에서도 보이도록 복사해 실행
+                            running[executor.submit(contextvars.copy_context().run, self._run_stage, name, fn)] = name
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        self.results[name] = future.result()
+                        done.add(name)
+                    except Exception as e:
+                        # 실패 시 새 단계는 시작하지 않고 실행 중인 단계만 마무리한 뒤 예외 전파
+                        error = error or e
+        if error is not None:
+            raise error
+        return self.results
+
+    def critical_path(self) -> dict:
+        """가장 늦게 끝난 단계에서 의존 관계를 거슬러 올라간 경로와 총 소요 시간"""
+        if not self.timings:
+            return {"stages": [], "seconds": 0.0}
+        name = max(self.timings, key=lambda n: self.timings[n]["end"])
+        total = self.timings[name]["end"]
+        path = [name]
+        while True:
+            deps = [d for d in self._stages[name][1] if d in self.timings]
+            if not deps:
+                break
+            name = max(deps, key=lambda n: self.timings[n]["end"])
+            path.append(name)
+        return {"stages": list(reversed(path)), "seconds": total}
+
 def extract_keywords_from_translation(translation_result):
     """Translation 결과에서 Key Visual Keywords 추출 (image_generator.py에서 가져옴)"""
     try:
@@ -67,19 +1570,37 @@ def extract_keywords_from_translation(translation_result):
 
 class MemeAgentCrew:
     def __init__(self):
-        # 도구 설정
+        # 키 검증만 즉시 수행하고, 도구/LLM/에이전트는 처음 필요한 시점에 생성 후 재사용
         _check_serper_key()
-        self.search_tool = SerperDevTool()
-        self.scrape_tool = ScrapeWebsiteTool()
-
-        # CrewAI의 LLM으로 provider+model을 명시
-        api_key = _get_api_key()
-        self.gemini_pro = LLM(api_key=api_key, model="gemini/gemini-2.5-pro")
-        self.gemini_flash = LLM(api_key=api_key, model="gemini/gemini-2.5-flash")
-        self.gemini_flash_lite = LLM(api_key=api_key, model="gemini/gemini-2.5-flash-lite")
-     
-        # 키워드 검색 및 기사 URL 수집 에이전트
-        self.search_agent = Agent(
+        self._api_key = _get_api_key()
+
+    # 도구 설정
+    @cached_property
+    def search_tool(self):
+        return _pooled_serper_dev_tool_class()()
+
+    @cached_property
+    def scrape_tool(self):
+        return _cached_scrape_website_tool_class()()
+
+    # CrewAI의 LLM으로 provider+model을 명시 (응답은 _llm_cache에 캐시)
+    @cached_property
+    def gemini_pro(self):
+        return _build_cached_llm("gemini/gemini-2.5-pro", self._api_key)
+
+    @cached_property
+    def gemini_flash(self):
+        return _build_cached_llm("gemini/gemini-2.5-flash", self._api_key)
+
+    @cached_property
+    def gemini_flash_lite(self):
+        return _build_cached_llm("gemini/gemini-2.5-flash-lite", self._api_key)
+
+    # 키워드 검색 및 기사 URL 수집 에이전트
+    @cached_property
+    def search_agent(self):
+        from crewai import Agent
+        return Agent(
             role='Korean News Search Expert',
             goal='Collect URLs and titles of the latest Korean news articles for given keywords',
             backstory=(
@@ -93,9 +1614,12 @@ class MemeAgentCrew:
             verbose=True,
             llm=self.gemini_flash_lite
         )
-       
-        # 뉴스 기사에서 본문을 추출하는 에이전트 (무한루프 방지 강화)
-        self.extractor_agent = Agent(
+
+    # 뉴스 기사에서 본문을 추출하는 에이전트 (무한루프 방지 강화)
+    @cached_property
+    def extractor_agent(self):
+        from crewai import Agent
+        return Agent(
             role='Korean News Content Extraction and Validation Expert',
             goal='Extract, validate, and filter Korean news content while preventing infinite loops and repetitive content',
             backstory=(
@@ -119,9 +1643,12 @@ class MemeAgentCrew:
             verbose=True,
             llm=self.gemini_flash_lite
         )
-    
-        # 요약한 기사 본문을 취합하여 요약하고 영어로 번역하는 에이전트
-        self.translator_agent = Agent(
+
+    # 요약한 기사 본문을 취합하여 요약하고 영어로 번역하는 에이전트
+    @cached_property
+    def translator_agent(self):
+        from crewai import Agent
+        return Agent(
             role='Article Summarization and English Translation Expert',
             goal='Summarize Korean articles to appropriate length and translate them into English',
             backstory=(
@@ -134,22 +1661,11 @@ class MemeAgentCrew:
             llm=self.gemini_pro
         )
 
-        # 이미지 URL 수집 에이전트 
-        self.collector_agent = Agent(
-            role='Korean Issue Image URL Collector',
-            goal='Find image URLs for Korean current affairs keywords using Serper search',
-            backstory="""
-            You are an expert at quickly finding relevant image URLs for Korean current affairs.
-            You use Serper image search to find appropriate images for each keyword.
-            You work efficiently and provide JSON results immediately.
-            """,
-            tools=[serper_image_search],
-            verbose=True,
-            llm=self.gemini_flash
-        )
-
-        # 웹사이트용 설명 생성 에이전트
-        self.description_agent = Agent(
+    # 웹사이트용 설명 생성 에이전트
+    @cached_property
+    def description_agent(self):
+        from crewai import Agent
+        return Agent(
             role='Website Description Generator',
             goal='Create concise 3-4 sentence descriptions for website tone setting',
             backstory=("""
@@ -161,8 +1677,11 @@ class MemeAgentCrew:
             llm=self.gemini_flash_lite
         )
 
-        # 이슈에 대한 풍자글을 작성하는 에이전트
-        self.writer_agent = Agent(
+    # 이슈에 대한 풍자글을 작성하는 에이전트
+    @cached_property
+    def writer_agent(self):
+        from crewai import Agent
+        return Agent(
             role='Memecoin Satirical Content Writing Expert',
             goal='Create funny and creative English memecoin satirical content based on collected news information',
             backstory="""
@@ -183,8 +1702,11 @@ class MemeAgentCrew:
             llm=self.gemini_pro
         )
 
-        # 토크노믹스와 로드맵을 작성하는 에이전트
-        self.tokenomics_agent = Agent(
+    # 토크노믹스와 로드맵을 작성하는 에이전트
+    @cached_property
+    def tokenomics_agent(self):
+        from crewai import Agent
+        return Agent(
             role='Memecoin Tokenomics & Roadmap Designer',
             goal='Generate absurd and funny tokenomics and roadmaps based on satirical content',
             backstory="""
@@ -204,8 +1726,11 @@ class MemeAgentCrew:
             llm=self.gemini_pro  
         )
 
-        # 웹사이트 봇 전달용 JSON 변환 에이전트 (이미지 URL 포함하도록 수정)
-        self.summary_agent = Agent(
+    # 웹사이트 봇 전달용 JSON 변환 에이전트 (이미지 URL 포함하도록 수정)
+    @cached_property
+    def summary_agent(self):
+        from crewai import Agent
+        return Agent(
             role='Website Bot Integration JSON Conversion Expert',
             goal='Convert satirical content, tokenomics, and image URLs into JSON format usable by website bots',
             backstory="""
@@ -219,6 +1744,7 @@ class MemeAgentCrew:
 
     def create_search_task(self, keyword: str, why_trending: str):
         context_term = (why_trending or "").split(".")[0]
+        from crewai import Task
         return Task(
             description=f"""
             Based on the given keyword '{keyword}' and trending reason '{why_trending}', you need to find the most accurate and relevant latest Korean news articles.
@@ -249,6 +1775,7 @@ class MemeAgentCrew:
     )
     
     def create_extraction_task(self):
+        from crewai import Task
         return Task(
             description="""
             Extract body content from the article URLs collected in the previous step.
@@ -257,10 +1784,9 @@ class MemeAgentCrew:
             - IMMEDIATELY STOP extraction if any single character repeats more than 50 times consecutively
             - IMMEDIATELY STOP if content length exceeds 10,000 characters without meaningful variation
             - IMMEDIATELY STOP if the same 3-character sequence appears more than 100 times
-            - Set maximum processing time of 2 minutes per URL
             
             Extraction Requirements:
-            1. Access each URL and extract article body content
+            1. Use the page_text already provided for each article; access a URL with the scraping tool only if page_text is missing
             2. Focus on extracting titles and key content from the first 2-3 paragraphs
             3. Exclude advertisements, related articles, comments, etc.
             4. Organize only key facts and contextual information
@@ -268,32 +1794,15 @@ class MemeAgentCrew:
             6. Skip inaccessible or failed extraction URLs and continue processing
             7. Write results using only successfully extracted articles
             8. Consider task complete if at least 1 article is successfully extracted
-            9. If Unicode decoding errors occur, skip that specific article and continue
+            9. Pages are already decoded (EUC-KR/CP949 included); skip an article only if its text is still garbled
             
-            **ENHANCED Quality Filters (MANDATORY CHECKS):**
-            10. Character Repetition Filters:
-            - If ANY single character (including 가, 나, 다, etc.) repeats more than 20 times consecutively, SKIP immediately
-            - If content contains more than 80% identical characters, SKIP
-            - If any 2-character pattern repeats more than 30 times, SKIP
-            
-            11. Content Length and Diversity Filters:
-            - If content is shorter than 100 characters, skip (too short)
-            - If content is longer than 5000 characters but has less than 50 unique characters, skip (repetitive content)
-            - If same exact sentence repeats 3+ times, skip
-            - If content contains less than 5 different complete Korean sentences, skip
-            
-            12. HTML and Navigation Filters:
-            - If content contains repeated HTML tag names (div, span, etc.) more than 15 times, skip
+            **Quality Filters:**
+            10. The scraping tool already rejects repetitive, too-short, non-Korean, HTML-heavy and login/cookie boilerplate pages.
+            - If the tool returns "Skipped ... failed quality checks", skip that article and continue
             - If content is primarily site navigation menus, footer text, or ads, skip
-            - If content contains more than 30% non-Korean characters (excluding spaces and punctuation), skip
-            
-            13. Korean News Site Specific:
             - Focus on extracting content within article body tags, not header/sidebar elements
-            - Skip if content is primarily login prompts, subscription messages, or error pages
-            - Skip if content contains more cookie/privacy policy text than actual news
             
             **Error Handling:**
-            - Set timeout of 120 seconds per article extraction
             - Exclude only the specific article for URL access failures, scraping blocks, etc.
             - Log failed articles but do not stop the entire operation
             - If more than 80% of articles fail extraction, report extraction system failure
@@ -324,6 +1833,7 @@ class MemeAgentCrew:
         )
     
     def create_translation_task(self):
+        from crewai import Task
         return Task(
             description="""
             Compile, summarize, and translate the extracted JSON format article content from the previous step into English.
@@ -380,15 +1890,8 @@ class MemeAgentCrew:
             agent=self.translator_agent
         )
 
-    # 이미지 URL 수집 태스크들 (image_generator.py에서 가져와서 적용)
-    def create_image_search_task(self, keyword):
-        return Task(
-            description=f"Use 'Serper Image Search' tool to find one image URL for the keyword: '{keyword}'",
-            expected_output="JSON string containing keyword and image_url",
-            agent=self.collector_agent
-        )
-
     def create_description_task(self):
+        from crewai import Task
         return Task(
             description="""
             Based on the Korean issue summary from the previous step, create a concise 3-4 sentence description that sets the overall tone for the website.
@@ -415,6 +1918,7 @@ class MemeAgentCrew:
     )
 
     def create_satire_task(self, keyword: str):
+        from crewai import Task
         return Task(
             description=f"""
             Write English memecoin satirical content based on the collected information about keyword '{keyword}'.
@@ -468,6 +1972,7 @@ class MemeAgentCrew:
         )
 
     def create_tokenomics_task(self, keyword: str):
+        from crewai import Task
         return Task(
             description=f"""
             Write tokenomics and roadmap based on the '{keyword}' memecoin satirical content generated in the previous step (context).
@@ -524,7 +2029,14 @@ class MemeAgentCrew:
             agent=self.tokenomics_agent
         )
 
-    def create_summary_task(self):
+    def create_summary_task(self, image_search_results: list = None):
+        from crewai import Task
+        # 이미지 검색 결과는 이전 이미지 수집 태스크 출력과 같은 형태({"keyword", "image_url"} JSON)로 전달
+        image_section = ""
+        if image_search_results:
+            image_section = "\n            Image search results (one JSON object per keyword, in keyword1..N order):\n" + "\n".join(
+                f"            {result}" for result in image_search_results
+            ) + "\n"
         return Task(
             description="""
             Extract appropriate information from all data generated in previous steps (article summaries, satirical content, image URLs, etc.) that matches the JSON structure requirements below, and convert it into JSON format usable by website bots.
@@ -562,14 +2074,22 @@ class MemeAgentCrew:
             3. Maintain special characters and emojis but ensure they don't break JSON structure
             4. Accurately classify and place content in each section
             5. For the "description" field, use the 3-4 sentence summary from the description_task result as is
-            6. Include image URLs collected from the image search tasks in the "image_urls" section
+            6. Include image URLs from the image search results in the "image_urls" section
             7. OUTPUT ONLY THE JSON - NO EXPLANATORY TEXT BEFORE OR AFTER
-            """,
+            """ + image_section,
             expected_output="Pure JSON data with no additional text or explanations",
             agent=self.summary_agent
         )
 
     def run_satire_generation(self, keyword: str, why_trending: str):
+        # 이번 실행의 외부 입력을 기록(replay 모드면 재생)하는 기록기를 단계들이 볼 수 있도록 설정
+        token = _current_run.set(RunRecorder(keyword, why_trending))
+        try:
+            return self._run_satire_generation(keyword, why_trending)
+        finally:
+            _current_run.reset(token)
+
+    def _run_satire_generation(self, keyword: str, why_trending: str):
         print(f"🤖 '{keyword}' 키워드로 전체 자동화 프로세스를 시작합니다...")
         print(f"📝 트렌딩 이유: {why_trending}\n")
         
@@ -582,12 +2102,6 @@ class MemeAgentCrew:
         
         translation_task = self.create_translation_task()
         translation_task.context = [extraction_task]
-
-        # 키워드 추출 후 이미지 검색 태스크들 생성
-        print("키워드 추출을 위한 임시 번역 실행...")
-        
-        # 이미지 검색을 위한 키워드는 번역 작업이 완료된 후 동적으로 생성해야 함
-        # 따라서 여기서는 placeholder로 생성하고 실제 실행 시에 키워드를 추출
         
         description_task = self.create_description_task()
         description_task.context = [translation_task]
@@ -598,60 +2112,102 @@ class MemeAgentCrew:
         tokenomics_task = self.create_tokenomics_task(keyword)
         tokenomics_task.context = [satire_task]
         
-        summary_task = self.create_summary_task()
+        # 요약 태스크는 이미지 검색 결과가 나온 뒤 생성
+        summary_task = None
+        keywords = []
+        stage_stats = {}
         
-        # 2. 첫 번째 단계: 번역까지만 실행해서 키워드를 추출
-        initial_crew = Crew(
-            agents=[self.search_agent, self.extractor_agent, self.translator_agent],
-            tasks=[search_task, extraction_task, translation_task],
-            process=Process.sequential,
-            verbose=True
-        )
+        # 2. 전체 파이프라인을 하나의 실행 그래프로 구성 (Crew 생성/kickoff 없이 한 번의 실행)
+        #    search ─> extraction ─> translation ─┬─> image_search (번역 결과의 키워드로 실행 중 추가) ─┐
+        #                                         ├─> description ────────────────────────────────┼─> summary
+        #                                         └─> satire ─> tokenomics ───────────────────────┘
+        graph = StageGraph()
+
+        # 최근 같은(정규화 기준) keyword/why_trending을 처리했다면 번역 결과를 재사용하고 검색/추출/번역을 생략
+        memo_key = _translation_memo_key(keyword, why_trending)
+        # 메모 적중 여부에 따라 실행 경로가 달라지므로 조회 결과도 실행 기록에 남김
+        memo = _replayable("translation_memo", memo_key, lambda: _translation_memo.get(memo_key))
+        stage_stats["translation_memo"] = "hit" if memo else "miss"
+
+        def _translation_stage(results):
+            if memo:
+                print("♻️ 최근 처리한 동일 입력의 번역 결과를 재사용합니다 (검색/추출/번역 생략)")
+                translation_result = memo["translation"]
+                self._set_task_output(translation_task, translation_result)
+            else:
+                # 번역은 Gemini Pro라 입력을 토큰 예산 안으로 줄여서 전달
+                context, budget_stats = trim_extraction_for_budget(extraction_task.output.raw)
+                stage_stats["translation_budget"] = budget_stats
+                if budget_stats["trimmed"]:
+                    print(f"✂️ 번역 입력 토큰 약 {budget_stats['tokens_before']} → {budget_stats['tokens_after']} "
+                          f"({budget_stats['tokens_saved']} 절감, 문장 {budget_stats['sentences_kept']}/{budget_stats['sentences_total']} 유지)")
+                translation_result = self._execute_task(translation_task, context=context)
+                extraction = _parse_json_output(extraction_task.output.raw)
+                if isinstance(extraction, dict) and not extraction.get("extracted_content"):
+                    # 추출된 기사 없이 만든 번역은 근거가 없으므로 재사용하지 않음
+                    print("⚠️ 추출된 기사가 없어 번역 결과를 메모에 저장하지 않습니다")
+                else:
+                    _translation_memo.set(memo_key, {
+                        "keyword": keyword,
+                        "why_trending": why_trending,
+                        "translation": translation_result,
+                    })
+
+            # 번역 결과에서 키워드 추출 후, 키워드에 의존하는 단계들을 그래프에 추가
+            keywords.extend(extract_keywords_from_translation(translation_result))
+            print(f"추출된 키워드: {keywords}")
+            graph.add_stage("image_search", lambda results: self._run_image_search_stage(keywords, stage_stats), deps=["translation"])
+            graph.add_stage("summary", _summary_stage, deps=["image_search", "description", "tokenomics"])
+            return translation_result
+
+        def _summary_stage(results):
+            nonlocal summary_task
+            image_results = results["image_search"]
+            image_search_results = [
+                json.dumps({"keyword": kw, "image_url": image_results[f"keyword{i+1}"]}, ensure_ascii=False)
+                for i, kw in enumerate(keywords)
+            ]
+            summary_task = self.create_summary_task(image_search_results)
+            summary_task.context = [translation_task, description_task, tokenomics_task]
+            return self._execute_task(summary_task)
+
+        if memo:
+            graph.add_stage("translation", _translation_stage)
+        else:
+            graph.add_stage("search", lambda results: self._execute_task(search_task))
+            graph.add_stage("extraction", lambda results: self._run_extraction_stage(search_task, extraction_task, stage_stats), deps=["search"])
+            graph.add_stage("translation", _translation_stage, deps=["extraction"])
+        graph.add_stage("description", lambda results: self._execute_task(description_task), deps=["translation"])
+        graph.add_stage("satire", lambda results: self._execute_task(satire_task), deps=["translation"])
+        graph.add_stage("tokenomics", lambda results: self._execute_task(tokenomics_task), deps=["satire"])
         
         try:
-            # 첫 번째 단계 실행
-            initial_crew.kickoff(inputs={"keyword": keyword, "why_trending": why_trending})
-            
-            # 번역 결과에서 키워드 추출
-            translation_result = translation_task.output.raw
-            keywords = extract_keywords_from_translation(translation_result)
-            print(f"추출된 키워드: {keywords}")
-            
-            # 키워드별 이미지 검색 태스크 생성
-            image_search_tasks = [self.create_image_search_task(kw) for kw in keywords]
-            
-            # 이미지 검색 태스크들을 요약 태스크의 context에 추가
-            summary_task.context = [translation_task, description_task, tokenomics_task] + image_search_tasks
+            graph.run()
+
+            stage_stats["stages"] = graph.timings
+            stage_stats["critical_path"] = graph.critical_path()
+            print("⏱️ 단계별 소요 시간: " + ", ".join(f"{name} {t['seconds']:.1f}초" for name, t in graph.timings.items()))
+            print(f"⏱️ 임계 경로: {' → '.join(stage_stats['critical_path']['stages'])} ({stage_stats['critical_path']['seconds']:.1f}초)")
+
+            # 이미지 검색이 생략한 수집 에이전트(Gemini Flash) 호출의 절감 시간은 이번 실행에서 잰 Flash 호출 시간으로 계산
+            savings = _current_run.get().llm_seconds_saved(self.gemini_flash.model, len(keywords), COLLECTOR_LLM_SECONDS_ESTIMATE)
+            stage_stats["image_search"].update(savings)
+            if savings["seconds_saved_basis"] == "measured":
+                print(f"🖼️ 이미지 검색 LLM 호출 {len(keywords)}회 생략: 이번 실행의 Gemini Flash 호출 {savings['calls_measured']}회 "
+                      f"평균 {savings['seconds_per_call']:.1f}초 기준 약 {savings['seconds_saved']:.1f}초 절감")
+            else:
+                print(f"🖼️ 이미지 검색 LLM 호출 {len(keywords)}회 생략: 이번 실행에서 잰 Gemini Flash 호출이 없어 "
+                      f"가정치 {savings['seconds_per_call']:.1f}초(COLLECTOR_LLM_SECONDS_ESTIMATE) 기준 약 {savings['seconds_saved']:.1f}초 절감 (가정)")
             
-            # 3. 두 번째 단계: 나머지 태스크들 실행
-            remaining_crew = Crew(
-                agents=[self.collector_agent, self.description_agent, self.writer_agent, self.tokenomics_agent, self.summary_agent],
-                tasks=image_search_tasks + [description_task, satire_task, tokenomics_task, summary_task],
-                process=Process.sequential,
-                verbose=True
-            )
-            
-            remaining_crew.kickoff(inputs={"keywords": keywords, "translation_result": translation_result})
-            
-            # 4. 실행 완료 후, 필요한 결과물을 각 Task 객체에서 직접 추출합니다.
+            # 3. 실행 완료 후, 필요한 결과물을 각 Task 객체에서 직접 추출합니다.
+            translation_result = graph.results["translation"]
+            image_results = graph.results["image_search"]
             description_result = description_task.output.raw
             satire_result = satire_task.output.raw
             tokenomics_result = tokenomics_task.output.raw
             summary_json = summary_task.output.raw
             
-            # 이미지 검색 결과 추출
-            image_results = {}
-            for i, (task, keyword) in enumerate(zip(image_search_tasks, keywords)):
-                try:
-                    if task.output:
-                        output_text = task.output.raw if hasattr(task.output, 'raw') else str(task.output)
-                        parsed_data = json.loads(output_text)
-                        image_results[f"keyword{i+1}"] = parsed_data.get("image_url", f"no_result_{i+1}")
-                except Exception as e:
-                    print(f"이미지 검색 결과 파싱 실패 ({keyword}): {e}")
-                    image_results[f"keyword{i+1}"] = f"parse_error_{i+1}"
-            
-            # 5. 파일 저장
+            # 4. 파일 저장
             os.makedirs("./outputs", exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
@@ -687,7 +2243,8 @@ class MemeAgentCrew:
                 'satire_content': satire_result,
                 'image_urls': image_results,
                 'keywords': keywords,
-                'translation_result': translation_result
+                'translation_result': translation_result,
+                'stage_stats': stage_stats
             }
             
         except Exception as e:
@@ -699,6 +2256,110 @@ class MemeAgentCrew:
             except:
                 return None
 
+    def _execute_task(self, task, context: str = None):
+        """Crew 없이 단일 태스크 실행. context를 주지 않으면 context 태스크 출력을 Crew와 같은 구분자로 합쳐 전달"""
+        if context is None:
+            context_tasks = task.context if isinstance(task.context, list) else []
+            context = "\n\n----------\n\n".join(t.output.raw for t in context_tasks if t.output)
+        return task.execute_sync(agent=task.agent, context=context, tools=task.tools or task.agent.tools).raw
+
+    def _run_extraction_stage(self, search_task, extraction_task, stage_stats: dict) -> str:
+        """기사 본문 추출. 다른 키워드/실행에서 이미 추출한 기사(정규화 URL 기준)는 저장소에서 재사용"""
+        search_result = _parse_json_output(search_task.output.raw)
+        articles = search_result.get("articles", []) if isinstance(search_result, dict) else []
+
+        # 재사용/수집 결과는 캐시 상태와 수집 타이밍에 따라 달라지므로 실행 기록에 남겨 replay에서 같은 입력으로 추출
+        inputs = _replayable("extraction_inputs", search_task.output.raw, lambda: self._collect_extraction_inputs(articles))
+        reused, new_articles, skipped = inputs["reused"], inputs["new_articles"], inputs["skipped"]
+        if inputs["fetch_stats"] is not None:
+            stage_stats["article_fetch"] = inputs["fetch_stats"]
+
+        if articles and not new_articles and not reused:
+            # 번역할 기사가 하나도 없으면 빈 입력으로 번역(및 번역 메모 저장)하지 않도록 실패 처리
+            raise RuntimeError("No article could be fetched for extraction (all URLs failed, timed out, were rejected or are backing off)")
+
+        extracted, unparsed, raw_output = [], None, None
+        if new_articles or not articles:
+            # 검색 결과를 파싱하지 못했으면 원래 context 그대로(에이전트가 직접 수집), 아니면 수집된 새 기사만 전달
+            context = None
+            if articles:
+                context = json.dumps(dict(search_result, articles=new_articles), ensure_ascii=False, indent=2)
+            raw_output = self._execute_task(extraction_task, context=context)
+            extraction_output = _parse_json_output(raw_output)
+            if isinstance(extraction_output, dict):
+                extracted = [a for a in extraction_output.get("extracted_content", []) if isinstance(a, dict)]
+            else:
+                unparsed = raw_output
+            for article in extracted:
+                if article.get("url"):
+                    _article_store.set(canonicalize_url(article["url"]), article)
+
+        stage_stats["article_store"] = {"reused": len(reused), "extracted": len(extracted), "skipped_known_bad": skipped}
+        if not reused and raw_output is not None:
+            return raw_output
+        print(f"♻️ 이미 추출한 기사 {len(reused)}건 재사용, 새로 추출 {len(extracted)}건")
+        merged = json.dumps({"extracted_content": reused + extracted}, ensure_ascii=False, indent=2)
+        if unparsed:
+            # 새 기사 추출 결과가 JSON이 아니면 버리지 않고 원문 그대로 덧붙임
+            merged += "\n\n" + unparsed
+        self._set_task_output(extraction_task, merged)
+        return merged
+
+    def _collect_extraction_inputs(self, articles: list) -> dict:
+        """검색된 기사 중 저장소에서 재사용할 기사와, 새로 동시 수집해 본문(page_text)을 붙인 기사를 고름"""
+        reused, new_articles, seen, skipped, fetch_stats = [], [], set(), 0, None
+        for article in articles:
+            url = article.get("url") if isinstance(article, dict) else None
+            if not url:
+                continue
+            cache_key = canonicalize_url(url)
+            if cache_key in seen:
+                continue
+            seen.add(cache_key)
+            stored = _article_store.get(cache_key)
+            if stored:
+                reused.append(stored)
+            elif get_url_block_reason(url):
+                # 최근 실패했거나 백오프 중인 도메인의 URL은 추출 단계에 넘기지 않음
+                skipped += 1
+            else:
+                new_articles.append(article)
+        if skipped:
+            print(f"🚫 최근 실패한 URL/도메인의 기사 {skipped}건 제외")
+
+        # 새 기사는 LLM이 하나씩 방문하지 않도록 미리 동시에 수집해 본문(page_text)을 붙여 넘긴다.
+        # 재사용 기사와 합쳐 EXTRACTION_TARGET_ARTICLES개가 되면 나머지는 기다리지 않음
+        need = max(0, EXTRACTION_TARGET_ARTICLES - len(reused))
+        if new_articles and need:
+            fetched = fetch_articles_concurrently([article["url"] for article in new_articles], want=need)
+            fetch_stats = fetched["stats"]
+            for url, reason in fetched["failed"].items():
+                print(f"⚠️ 기사 수집 제외: {url} ({reason})")
+            new_articles = [
+                dict(article, page_text=fetched["articles"][article["url"]])
+                for article in new_articles if article["url"] in fetched["articles"]
+            ]
+        elif new_articles:
+            print(f"⏭️ 재사용 기사 {len(reused)}건으로 충분해 새 기사 {len(new_articles)}건은 수집하지 않음")
+            new_articles = []
+        return {"reused": reused, "new_articles": new_articles, "skipped": skipped, "fetch_stats": fetch_stats}
+
+    def _set_task_output(self, task, raw: str):
+        """태스크를 실행하지 않고 결과만 채움 (뒤 태스크들이 context로 읽을 수 있도록)"""
+        from crewai.tasks.task_output import TaskOutput
+        task.output = TaskOutput(description=task.description, raw=raw, agent=task.agent.role)
+
+    def _run_image_search_stage(self, keywords: list, stage_stats: dict) -> dict:
+        """키워드별 이미지 검색: 검색어가 이미 정해져 있으므로 LLM 에이전트를 거치지 않고 serper_image_search를 직접 실행"""
+        image_stage_start = time.perf_counter()
+        # 이미지 URL은 요약 프롬프트에 들어가므로 실행 기록에 남김
+        image_results = _replayable("image_search", keywords, lambda: search_images_concurrently(keywords))
+        image_stage_seconds = time.perf_counter() - image_stage_start
+        # 생략한 LLM 호출의 절감 시간은 Gemini Flash 호출 시간을 잴 수 있는 실행 종료 시점에 채움
+        stage_stats["image_search"] = {"keywords": len(keywords), "seconds": round(image_stage_seconds, 3)}
+        print(f"🖼️ 이미지 검색 {len(keywords)}건 LLM 없이 직접 실행 ({image_stage_seconds:.2f}초)")
+        return image_results
+
     def _get_partial_results(self, tasks):
         """에러 발생 시 부분적으로라도 완성된 결과를 반환"""
         results = {}
@@ -733,6 +2394,230 @@ class MemeAgentCrew:
         
         return None
 
+# 프로세스 전역 MemeAgentCrew 풀 (워커 스레드 간 에이전트/LLM 클라이언트 재사용)
+class MemeAgentCrewPool:
+    """크기가 제한된 스레드 안전 MemeAgentCrew 풀. checkout()으로 빌려 쓰고 자동 반납"""
+
+    def __init__(self, max_size: int = 4, factory=MemeAgentCrew):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.max_size = max_size
+        self._factory = factory
+        self._idle = []  # LIFO: 가장 최근에 반납된(가장 따뜻한) 인스턴스부터 재사용
+        self._size = 0
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self._metrics = {
+            "checkouts": 0,     # 전체 대여 횟수
+            "hits": 0,          # 대기 중인 인스턴스를 바로 재사용한 횟수
+            "created": 0,       # 새로 생성한 인스턴스 수
+            "waits": 0,         # 풀이 가득 차서 반납을 기다린 횟수
+            "wait_seconds": 0.0,
+            "discarded": 0,     # 오류로 폐기된 인스턴스 수
+        }
+
+    def acquire(self, timeout: float = None) -> MemeAgentCrew:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._metrics["checkouts"] += 1
+            waited = False
+            wait_start = time.monotonic()
+            while not self._idle and self._size >= self.max_size:
+                if not waited:
+                    waited = True
+                    self._metrics["waits"] += 1
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._metrics["wait_seconds"] += time.monotonic() - wait_start
+                    raise TimeoutError(f"No MemeAgentCrew available within {timeout}s (pool size {self.max_size})")
+                self._cond.wait(remaining)
+            if waited:
+                self._metrics["wait_seconds"] += time.monotonic() - wait_start
+
+            self._in_use += 1
+            if self._idle:
+                self._metrics["hits"] += 1
+                return self._idle.pop()
+            self._size += 1
+
+        # 생성은 락 밖에서 수행 (다른 스레드의 반납/대여를 막지 않도록)
+        try:
+            crew = self._factory()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._metrics["created"] += 1
+        return crew
+
+    def release(self, crew: MemeAgentCrew, discard: bool = False):
+        with self._cond:
+            self._in_use -= 1
+            if discard:
+                self._size -= 1
+                self._metrics["discarded"] += 1
+            else:
+                self._idle.append(crew)
+            self._cond.notify()
+
+    @contextmanager
+    def checkout(self, timeout: float = None):
+        crew = self.acquire(timeout)
+        try:
+            yield crew
+        except BaseException:
+            # 실행 도중 예외가 전파된 인스턴스는 상태를 신뢰할 수 없으므로 폐기
+            self.release(crew, discard=True)
+            raise
+        else:
+            self.release(crew)
+
+    def stats(self) -> dict:
+        with self._cond:
+            stats = dict(self._metrics)
+            stats.update(max_size=self.max_size, size=self._size, idle=len(self._idle), in_use=self._in_use)
+        stats["hit_ratio"] = stats["hits"] / stats["checkouts"] if stats["checkouts"] else 0.0
+        return stats
+
+_crew_pool = None
+_crew_pool_lock = threading.Lock()
+
+def get_crew_pool() -> MemeAgentCrewPool:
+    """프로세스 전역 풀 반환 (크기는 MEME_CREW_POOL_SIZE, 기본 4)"""
+    global _crew_pool
+    if _crew_pool is None:
+        with _crew_pool_lock:
+            if _crew_pool is None:
+                _crew_pool = MemeAgentCrewPool(max_size=int(os.getenv("MEME_CREW_POOL_SIZE", "4")))
+    return _crew_pool
+
+# 유사 트렌드 요청 병합: 같은 keyword(호칭 등 덧붙은 단어 허용)에 거의 같은 why_trending이 들어오면 기존(또는 진행 중) 결과를 재사용
+TREND_DEDUP_THRESHOLD = float(os.getenv("TREND_DEDUP_THRESHOLD", "0.8"))  # 1보다 크게 주면 비활성화
+TREND_DEDUP_WINDOW = float(os.getenv("TREND_DEDUP_WINDOW", "3600"))
+# 진행 중인 유사 요청을 기다리는 최대 시간(초). 넘으면 기다리지 않고 직접 실행
+TREND_DEDUP_WAIT_TIMEOUT = float(os.getenv("TREND_DEDUP_WAIT_TIMEOUT", "600"))
+
+class TrendDeduplicator:
+    """최근 (keyword, why_trending) 입력에 대한 MinHash 유사도 인덱스 (프로세스 단위)
+
+    keyword가 같은 대상을 가리키는 최근 항목(keywords_match) 중에서, why_trending을 정규화한 글자 n-gram(shingle)
+    집합의 추정 Jaccard 유사도가 threshold 이상인 항목이 있으면 새 파이프라인을 시작하지 않고 그 결과를
+    (진행 중이면 최대 wait_timeout초 기다려) 돌려준다. 비슷한 설명만으로 다른 인물의 결과가 돌아가지 않도록 keyword는 따로 비교한다.
+    실패하거나 부분 결과로 끝난 요청은 인덱스에서 빼서 이후 요청에 재사용하지 않는다.
+    """
+
+    _PRIME = (1 << 61) - 1
+
+    def __init__(self, threshold: float = TREND_DEDUP_THRESHOLD, window: float = TREND_DEDUP_WINDOW,
+                 num_perm: int = 64, shingle_size: int = 3, wait_timeout: float = TREND_DEDUP_WAIT_TIMEOUT):
+        self.threshold = threshold
+        self.window = window
+        self.wait_timeout = wait_timeout
+        self.shingle_size = shingle_size
+        rng = random.Random(1)  # 프로세스 간 같은 서명을 얻기 위해 고정 시드 사용
+        self._perms = [(rng.randrange(1, self._PRIME), rng.randrange(0, self._PRIME)) for _ in range(num_perm)]
+        self._entries = []
+        self._lock = threading.Lock()
+        self._metrics = {"requests": 0, "started": 0, "collapsed": 0, "collapsed_in_flight": 0, "wait_timeouts": 0}
+
+    @staticmethod
+    def keywords_match(keyword_a: str, keyword_b: str) -> bool:
+        """정규화한 keyword가 같거나, 한쪽 단어들이 다른 쪽에 모두 포함되면(예: '이춘석' / '이춘석 의원') 같은 대상으로 본다"""
+        tokens_a, tokens_b = _normalize_trend_text(keyword_a).split(), _normalize_trend_text(keyword_b).split()
+        if not tokens_a or not tokens_b:
+            return False
+        if "".join(tokens_a) == "".join(tokens_b):
+            return True
+        return set(tokens_a) <= set(tokens_b) or set(tokens_b) <= set(tokens_a)
+
+    def signature(self, why_trending: str) -> tuple:
+        text = _normalize_trend_text(why_trending)
+        n = self.shingle_size
+        shingles = {text[i:i + n] for i in range(max(1, len(text) - n + 1))}
+        hashes = [int.from_bytes(hashlib.blake2b(sh.encode("utf-8"), digest_size=8).digest(), "big") for sh in shingles]
+        return tuple(min((a * h + b) % self._PRIME for h in hashes) for a, b in self._perms)
+
+    @staticmethod
+    def similarity(sig_a: tuple, sig_b: tuple) -> float:
+        return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+    def run(self, keyword: str, why_trending: str, fn):
+        """유사한 최근/진행 중 요청이 있으면 그 결과를, 없으면 fn()을 실행한 결과를 반환"""
+        sig = self.signature(why_trending)
+        now = time.monotonic()
+        with self._lock:
+            self._metrics["requests"] += 1
+            self._entries = [e for e in self._entries if now - e["created"] < self.window]
+            best, best_score = None, self.threshold
+            for entry in self._entries:
+                if not self.keywords_match(keyword, entry["keyword"]):
+                    continue
+                score = self.similarity(sig, entry["signature"])
+                if score >= best_score:
+                    best, best_score = entry, score
+            if best is not None:
+                self._metrics["collapsed"] += 1
+                if not best["done"].is_set():
+                    self._metrics["collapsed_in_flight"] += 1
+            else:
+                best = {"signature": sig, "keyword": keyword, "created": now,
+                        "done": threading.Event(), "result": None, "error": None}
+                self._entries.append(best)
+                self._metrics["started"] += 1
+                best_score = None
+
+        if best_score is not None:
+            print(f"🔁 '{keyword}' 요청을 유사한 '{best['keyword']}' 결과로 대체합니다 (유사도 {best_score:.2f})")
+            if best["done"].wait(self.wait_timeout):
+                if best["error"] is not None:
+                    raise best["error"]
+                return dict(best["result"], deduplicated_from=best["keyword"])
+            # 진행 중인 요청이 너무 오래 걸리면 더 기다리지 않고 직접 실행 (이 실행은 인덱스에 넣지 않음)
+            print(f"⏳ '{best['keyword']}' 결과를 {self.wait_timeout:.0f}초 기다렸지만 끝나지 않아 '{keyword}'를 직접 실행합니다")
+            with self._lock:
+                self._metrics["wait_timeouts"] += 1
+            return fn()
+
+        try:
+            result = fn()
+            best["result"] = result
+        except Exception as e:
+            best["error"] = e
+            raise
+        finally:
+            # 실패/부분 결과는 이후 요청에 재사용하지 않도록 인덱스에서 제거 (대기 중인 요청에는 그대로 전달)
+            outcome = best["result"]
+            if best["error"] is not None or not outcome or "error" in outcome or outcome.get("partial"):
+                with self._lock:
+                    if best in self._entries:
+                        self._entries.remove(best)
+                if best["error"] is None and not best["result"]:
+                    best["result"] = {"error": "풍자글 생성에 실패했습니다."}
+            best["done"].set()
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._metrics)
+            stats.update(threshold=self.threshold, window=self.window, indexed=len(self._entries))
+        stats["collapse_ratio"] = stats["collapsed"] / stats["requests"] if stats["requests"] else 0.0
+        return stats
+
+_trend_deduplicator = None
+_trend_deduplicator_lock = threading.Lock()
+
+def get_trend_deduplicator() -> TrendDeduplicator:
+    """프로세스 전역 유사 트렌드 인덱스 반환"""
+    global _trend_deduplicator
+    if _trend_deduplicator is None:
+        with _trend_deduplicator_lock:
+            if _trend_deduplicator is None:
+                _trend_deduplicator = TrendDeduplicator()
+    return _trend_deduplicator
+
 # 팀 연동을 위한 함수
 def generate_satire_for_team(input_data: dict) -> dict:
     """
@@ -752,11 +2637,11 @@ def generate_satire_for_team(input_data: dict) -> dict:
             'image_urls': dict,         # 이미지 URL들
             'keywords': list,           # 추출된 키워드들
             'translation_result': str,  # 번역 결과
+            'stage_stats': dict,        # 단계별 실행 통계 (LLM 호출/시간 절감 등)
+            'deduplicated_from': str,   # 유사 요청 결과를 재사용한 경우 원래 키워드 (optional)
             'partial': bool             # 부분 완성 여부 (optional)
         }
     """
-    meme_crew = MemeAgentCrew()
-    
     keyword = input_data.get("keyword", "")
     why_trending = input_data.get("why_trending", "")
     
@@ -764,7 +2649,20 @@ def generate_satire_for_team(input_data: dict) -> dict:
         return {"error": "키워드가 제공되지 않았습니다."}
     
     try:
-        result = meme_crew.run_satire_generation(keyword, why_trending)
+        def _run_pipeline():
+            # 매 호출마다 새로 만들지 않고 풀에서 이미 준비된 인스턴스를 빌려 사용
+            pool = get_crew_pool()
+            meme_crew = pool.acquire()
+            result = None
+            try:
+                result = meme_crew.run_satire_generation(keyword, why_trending)
+                return result
+            finally:
+                # run_satire_generation은 예외를 잡아 None/부분 결과로 돌려주므로, 예외뿐 아니라 실패한 실행의 인스턴스도 폐기
+                pool.release(meme_crew, discard=not result or bool(result.get("partial")))
+
+        # 최근/진행 중인 유사 요청이 있으면 새 파이프라인 없이 그 결과를 사용
+        result = get_trend_deduplicator().run(keyword, why_trending, _run_pipeline)
         return result if result else {"error": "풍자글 생성에 실패했습니다."}
     except Exception as e:
         return {"error": f"풍자글 생성 중 오류 발생: {str(e)}"}
@@ -800,16 +2698,8 @@ def generate_image_for_team(input_data: dict) -> dict:
                 translation_content = input_data['translation_result']
                 keywords = extract_keywords_from_translation(translation_content)
                 
-                # 각 키워드에 대해 이미지 검색 수행
-                image_results = {}
-                for i, keyword in enumerate(keywords):
-                    try:
-                        search_result = serper_image_search(keyword)
-                        parsed_result = json.loads(search_result)
-                        image_results[f"keyword{i+1}"] = parsed_result.get("image_url", f"no_result_{i+1}")
-                    except Exception as e:
-                        print(f"이미지 검색 실패 ({keyword}): {e}")
-                        image_results[f"keyword{i+1}"] = f"search_error_{i+1}"
+                # 각 키워드에 대해 이미지 검색을 동시에 수행 (결과는 키워드 순서 유지)
+                image_results = search_images_concurrently(keywords)
                 
                 return {
                     'success': True,
@@ -828,6 +2718,101 @@ def generate_image_for_team(input_data: dict) -> dict:
             'error': f'이미지 생성 실패: {str(e)}'
         }
 
+# 캐시 워밍업 (피크 시간 전에 검색/기사/이미지 캐시를 미리 채움, LLM 단계는 실행하지 않음)
+WARMUP_CONCURRENCY = int(os.getenv("WARMUP_CONCURRENCY", "4"))
+WARMUP_ARTICLES_PER_KEYWORD = int(os.getenv("WARMUP_ARTICLES_PER_KEYWORD", "5"))
+
+def _warmup_search_queries(keyword: str, why_trending: str) -> list:
+    """create_search_task가 안내하는 검색 전략과 같은 형태의 검색어 목록"""
+    context_term = (why_trending or "").split(".")[0]
+    queries = [f'"{keyword}" site:news.naver.com', f'"{keyword}" site:v.daum.net', f'"{keyword}" 최신 뉴스']
+    if context_term:
+        queries.append(f'"{keyword}" {context_term}')
+    return queries
+
+def _warm_entry(entry: dict) -> dict:
+    keyword = entry["keyword"]
+    stats = {"searches": 0, "articles": 0, "article_failures": 0, "images": 0, "errors": 0}
+
+    urls = []
+    for query in _warmup_search_queries(keyword, entry.get("why_trending", "")):
+        try:
+            results = serper_web_search(query)
+            stats["searches"] += 1
+            urls.extend(item["link"] for item in results.get("organic", []) if item.get("link"))
+        except Exception as e:
+            print(f"⚠️ 워밍업 검색 실패 ({query}): {e}")
+            stats["errors"] += 1
+
+    seen = set()
+    for url in urls:
+        if len(seen) >= WARMUP_ARTICLES_PER_KEYWORD:
+            break
+        cache_key = canonicalize_url(url)
+        if cache_key in seen or get_url_block_reason(url):
+            continue
+        seen.add(cache_key)
+        try:
+            fetch_article_text(url)
+            stats["articles"] += 1
+        except Exception:
+            # 실패는 fetch_article_text에서 네거티브 캐시에 기록됨
+            stats["article_failures"] += 1
+
+    # 파이프라인은 번역에서 뽑은 영어 시각 키워드로만 이미지를 검색하므로, keyword(주로 한글 이름)가 아니라 image_keywords만 워밍업
+    for image_keyword in entry.get("image_keywords") or []:
+        result = json.loads(serper_image_search(image_keyword))
+        if result["image_url"].startswith(("Search error", "API key missing")):
+            stats["errors"] += 1
+        else:
+            stats["images"] += 1
+    return stats
+
+def warm_caches(path: str = "warmup.jsonl", concurrency: int = WARMUP_CONCURRENCY) -> dict:
+    """JSON Lines 파일의 대기 입력으로 검색/기사/이미지 캐시를 미리 채움
+
+    각 줄은 {"keyword": str, "why_trending": str, "image_keywords": [str, ...] (optional)} 형식이며,
+    keyword가 없는 줄은 건너뛴다. 이미지 캐시는 image_keywords(번역 단계가 뽑을 영어 시각 키워드)가 있을 때만 채운다.
+    저장소 루트의 requests.jsonl은 작업 목록 파일로 이 형식이 아니므로 워밍업 입력으로 쓸 수 없다.
+    입력 단위로 최대 concurrency개를 동시에 처리한다.
+    """
+    _check_serper_key()
+    entries, skipped = [], 0
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                skipped += 1
+                continue
+            if isinstance(entry, dict) and entry.get("keyword"):
+                entries.append(entry)
+            else:
+                skipped += 1
+    if skipped and not entries:
+        print(f"⚠️ {path}의 {skipped}줄 모두 keyword가 없어 건너뜀 "
+              '(각 줄은 {"keyword": ..., "why_trending": ..., "image_keywords": [...]} 형식이어야 합니다)')
+
+    start = time.perf_counter()
+    totals = {"entries": len(entries), "skipped_lines": skipped,
+              "searches": 0, "articles": 0, "article_failures": 0, "images": 0, "errors": 0}
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {executor.submit(_warm_entry, entry): entry for entry in entries}
+        for future in futures:
+            try:
+                for name, value in future.result().items():
+                    totals[name] += value
+            except Exception as e:
+                print(f"⚠️ 워밍업 실패 ({futures[future]['keyword']}): {e}")
+                totals["errors"] += 1
+    totals["seconds"] = round(time.perf_counter() - start, 3)
+    print(f"🔥 캐시 워밍업 완료: 입력 {totals['entries']}건, 검색 {totals['searches']}건, "
+          f"기사 {totals['articles']}건, 이미지 {totals['images']}건 ({totals['seconds']:.1f}초)")
+    return totals
+
 # 메인 실행 함수
 def main():
     """테스트용 메인 함수"""
@@ -881,6 +2866,22 @@ def quick_test():
         print(f"🌐 JSON 데이터: {result.get('json_data')[:200] if result.get('json_data') else 'JSON 없음'}...")
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "warmup":
+        # 캐시 워밍업: python main.py warmup [입력 JSONL 경로, 기본 warmup.jsonl] [동시 실행 수]
+        # (저장소의 requests.jsonl은 작업 목록이라 {keyword, why_trending, image_keywords} 형식이 아님)
+        warm_caches(
+            sys.argv[2] if len(sys.argv) > 2 else "warmup.jsonl",
+            int(sys.argv[3]) if len(sys.argv) > 3 else WARMUP_CONCURRENCY,
+        )
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "cache-stats":
+        # 캐시 통계: python main.py cache-stats [--json]
+        if "--json" in sys.argv[2:]:
+            print(json.dumps(get_cache_stats(), ensure_ascii=False, indent=2))
+        else:
+            print_cache_stats()
+        sys.exit(0)
+
     # 실행 방법 선택
     print("실행 모드를 선택하세요:")
     print("1. 전체 테스트 (main)")
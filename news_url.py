@@ -0,0 +1,54 @@
+# news_url.py
+# 캐시/중복 제거 키용 URL 정규화 (네이버/다음/연합뉴스 기사 URL 변형을 하나의 표준 주소로 합침, 네트워크 호출 없음)
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# 캐시 키에서 지우는 추적용 쿼리 파라미터
+_TRACKING_PARAM_PREFIXES = ("utm_",)
+_TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "ref", "ref_src"}
+# 같은 기사를 가리키는 포털/언론사 URL 변형 (모바일/데스크톱, 구형 read.nhn, 리다이렉트 도메인)
+NAVER_ARTICLE_PATH = re.compile(r"^/(?:mnews/)?article/(\d+)/(\d+)")
+_DAUM_ARTICLE_PATH = re.compile(r"^/v/(\w+)")
+_YNA_ARTICLE_PATH = re.compile(r"^/view/(\w+)")
+
+def _canonicalize_news_url(host: str, path: str, query: dict):
+    """알려진 뉴스 사이트의 기사 URL을 하나의 표준 형태로 변환. 해당 없으면 None"""
+    if host.endswith("naver.com"):
+        match = NAVER_ARTICLE_PATH.match(path)
+        oid, aid = (match.groups() if match else (query.get("oid"), query.get("aid")))
+        if oid and aid:
+            if "entertain" in host:
+                return f"https://m.entertain.naver.com/article/{oid}/{aid}"
+            if "sports" in host:
+                return f"https://m.sports.naver.com/article/{oid}/{aid}"
+            return f"https://n.news.naver.com/article/{oid}/{aid}"
+    elif host.endswith("daum.net"):
+        # v.daum.net, news.v.daum.net, m.news.daum.net, v.media.daum.net 등은 모두 v.daum.net/v/<id>로 이동
+        match = _DAUM_ARTICLE_PATH.match(path)
+        if match:
+            return f"https://v.daum.net/v/{match.group(1)}"
+    elif host.endswith("yna.co.kr"):
+        match = _YNA_ARTICLE_PATH.match(path)
+        if match:
+            return f"https://www.yna.co.kr/view/{match.group(1)}"
+    return None
+
+def canonicalize_url(url: str) -> str:
+    """캐시/중복 제거 키용 URL 정규화
+
+    네이버/다음/연합뉴스 기사 URL은 모바일·데스크톱·구형 주소를 하나의 표준 주소로 합치고,
+    그 외에는 scheme/host 소문자화, 기본 포트/fragment/추적 파라미터 제거, 쿼리 정렬만 수행한다.
+    """
+    parts = urlsplit((url or "").strip())
+    scheme = (parts.scheme or "https").lower()
+    host = (parts.hostname or "").lower()
+    news_url = _canonicalize_news_url(host, parts.path, dict(parse_qsl(parts.query)))
+    if news_url:
+        return news_url
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith(_TRACKING_PARAM_PREFIXES)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
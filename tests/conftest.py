@@ -0,0 +1,29 @@
+# tests/conftest.py
+# 테스트 공통 fixture: main의 캐시를 테스트마다 비어 있는 임시 SQLite 파일로 분리
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def isolated_caches(monkeypatch, tmp_path):
+    """main의 모든 캐시(영속/메모리)를 비어 있는 임시 캐시로 교체하고, 끝나면 원래 캐시로 되돌림"""
+    import main
+
+    path = str(tmp_path / "meme_cache.sqlite3")
+    for cache in main._ALL_CACHES:
+        monkeypatch.setattr(cache, "_counters", dict.fromkeys(cache._counters, 0))
+        if isinstance(cache, main.PersistentCache):
+            monkeypatch.setattr(cache, "path", path)
+            monkeypatch.setattr(cache, "_local", threading.local())
+            monkeypatch.setattr(cache, "_pending", {})
+        else:
+            monkeypatch.setattr(cache, "_data", OrderedDict())
+    yield main
+    # 종료 시 카운터가 원래 캐시 파일에 기록되지 않도록 임시 파일에 먼저 기록
+    main.flush_cache_counters()
@@ -0,0 +1,118 @@
+# tests/test_article_fetch.py
+# 기사 수집이 URL별 deadline을 넘겨서 난 오류를 사이트 장애로 기록하지 않는지,
+# 기사 캐시가 신선한 항목만 적중으로 세고 HTML을 따로 저장하는지 확인 (네트워크 호출 없음)
+# 실행: python -m pytest -q tests
+import time
+
+import pytest
+import requests
+
+URL = "https://n.news.naver.com/article/001/0015000000"
+
+
+class _FailingSession:
+    """get()이 delay초 뒤 예외를 내는 세션 (재시도가 소진된 읽기 타임아웃은 requests에서 ConnectionError로 나옴)"""
+
+    def __init__(self, delay: float, error: Exception):
+        self.delay = delay
+        self.error = error
+        self.timeouts = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        self.timeouts.append(timeout)
+        time.sleep(self.delay)
+        raise self.error
+
+
+def test_error_after_deadline_is_not_recorded_as_site_failure(isolated_caches, monkeypatch):
+    main = isolated_caches
+    session = _FailingSession(0.1, requests.ConnectionError("Read timed out."))
+    monkeypatch.setattr(main, "_get_article_session", lambda: session)
+
+    deadline = time.monotonic() + 0.05
+    with pytest.raises(TimeoutError):
+        main.fetch_article_text(URL, deadline=deadline)
+    # 타임아웃은 남은 시간 안으로 줄여서 요청
+    assert all(t <= 0.05 for t in session.timeouts[0])
+    assert main._domain_health.get("n.news.naver.com") is None
+    assert main.get_url_block_reason(URL) is None
+
+
+def test_error_before_deadline_is_recorded_as_site_failure(isolated_caches, monkeypatch):
+    main = isolated_caches
+    monkeypatch.setattr(main, "_get_article_session", lambda: _FailingSession(0, requests.ConnectionError("Connection reset")))
+
+    with pytest.raises(requests.ConnectionError):
+        main.fetch_article_text(URL, deadline=time.monotonic() + 30)
+    health = main._domain_health.get("n.news.naver.com")
+    assert health["failures"] == 1
+    assert "Connection reset" in main.get_url_block_reason(URL)
+
+
+def test_article_session_does_not_retry():
+    pytest.importorskip("requests.adapters")
+    import main
+
+    adapter = main._get_article_session().get_adapter(URL)
+    assert adapter.max_retries.total == 0
+
+
+class _Response:
+    def __init__(self, status: int, body: bytes = b"", headers: dict = None):
+        self.status_code = status
+        self.body = body
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        yield self.body
+
+
+class _ScriptedSession:
+    """정해 둔 응답을 차례로 돌려주고 요청 헤더를 기록하는 세션"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.request_headers = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        self.request_headers.append(headers)
+        return self.responses.pop(0)
+
+
+def test_only_fresh_entries_count_as_hits_and_html_is_stored_separately(isolated_caches, monkeypatch):
+    main = isolated_caches
+    # 본문 추출 대신 파서 버전과 HTML을 그대로 돌려줘 다시 파싱됐는지 확인
+    monkeypatch.setattr(main, "_article_text", lambda html, url, learn: f"v{main.ARTICLE_PARSER_VERSION}:{html}")
+    html = "<html><body><p>본문</p></body></html>"
+    session = _ScriptedSession(
+        _Response(200, html.encode("utf-8"), {"Content-Type": "text/html; charset=utf-8", "ETag": '"v1"'}),
+        _Response(304),
+        _Response(304),
+    )
+    monkeypatch.setattr(main, "_get_article_session", lambda: session)
+    version = main.ARTICLE_PARSER_VERSION
+
+    assert main.fetch_article_text(URL) == f"v{version}:{html}"  # 새로 수집 (미스)
+    assert main.fetch_article_text(URL) == f"v{version}:{html}"  # 신선한 항목 (적중)
+    monkeypatch.setattr(main, "ARTICLE_CACHE_FRESH_SECONDS", 0)
+    assert main.fetch_article_text(URL) == f"v{version}:{html}"  # 304 재검증 (네트워크 요청이 있으므로 미스)
+    assert session.request_headers[1]["If-None-Match"] == '"v1"'
+    stats = main._article_cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+    # 파서가 바뀐 뒤 304를 받으면 따로 저장한 HTML로 다시 파싱
+    monkeypatch.setattr(main, "ARTICLE_PARSER_VERSION", version + 1)
+    assert main.fetch_article_text(URL) == f"v{version + 1}:{html}"
+
+    key = main.canonicalize_url(URL)
+    assert "html" not in main._article_cache.get(key)
+    assert main._article_html_cache.get(key) == html
@@ -0,0 +1,39 @@
+# tests/test_boilerplate.py
+# 언론사별 상용구 줄 학습이 공통 문구만 지우고, 같은 기사를 다시 내려받아도 그 본문 문단을 상용구로 학습하지 않는지 확인
+# 실행: python -m pytest -q tests
+BYLINE = "ⓒ 경향신문 무단전재 및 재배포 금지"
+TOPICS = ["예산안", "부동산", "반도체", "폭염", "선거구", "의대 정원"]
+QUOTE_A = "여야는 막판까지 쟁점 예산을 두고 협상을 이어가며 합의점을 찾지 못했다."
+QUOTE_B = "정부는 이번 예산이 민생 안정에 초점을 맞췄다고 거듭 설명했다."
+POPULAR_URL = "https://www.khan.co.kr/article/202509091800001"
+
+
+def _learn_topic_pages(main):
+    for i, topic in enumerate(TOPICS):
+        paragraphs = [f"{topic} 관련 논란이 커지고 있다.", f"{topic} 문제를 두고 전문가들의 의견이 엇갈렸다.", BYLINE]
+        main.strip_boilerplate(f"https://www.khan.co.kr/article/20250909{'abcdef'[i]}", paragraphs)
+
+
+def test_line_seen_on_most_pages_is_stripped(isolated_caches):
+    main = isolated_caches
+    _learn_topic_pages(main)
+    paragraphs = ["새로운 기사의 첫 문단이다.", BYLINE]
+    assert main.strip_boilerplate("https://www.khan.co.kr/article/new", paragraphs, learn=False) == ["새로운 기사의 첫 문단이다."]
+
+
+def test_refetched_article_is_learned_only_once(isolated_caches):
+    main = isolated_caches
+    _learn_topic_pages(main)
+    # 캐시 신선도 만료/파서 버전 변경으로 같은 인기 기사를 여러 번 다시 내려받은 상황
+    for _ in range(6):
+        main.strip_boilerplate(POPULAR_URL, ["인기 기사의 도입 문단이다.", QUOTE_A, QUOTE_B, BYLINE])
+    # 같은 기사의 모바일/추적 파라미터 URL도 같은 기사로 취급
+    main.strip_boilerplate(POPULAR_URL + "?utm_source=naver#comments", [QUOTE_A, QUOTE_B, BYLINE])
+
+    index = main._boilerplate_index.get("www.khan.co.kr")
+    assert index["pages"] == len(TOPICS) + 1
+
+    # 인기 기사 문단을 인용한 다른 기사에서 인용 문단은 남고 바이라인만 제거됨
+    quoting = ["다른 기사의 도입 문단이다.", QUOTE_A, QUOTE_B, BYLINE]
+    stripped = main.strip_boilerplate("https://www.khan.co.kr/article/202509101200001", quoting)
+    assert stripped == ["다른 기사의 도입 문단이다.", QUOTE_A, QUOTE_B]
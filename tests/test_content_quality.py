@@ -0,0 +1,93 @@
+# tests/test_content_quality.py
+# 기사 본문 품질 필터(check_content_quality)의 규칙별 판정 코드와 경계값 확인
+# 실행: python -m pytest -q tests
+import pytest
+
+from content_quality import check_content_quality
+
+SENTENCES = [
+    "국회는 18일 본회의를 열어 내년도 예산안을 처리했다.",
+    "여야는 막판까지 지역 사업 예산을 두고 협상을 이어갔다.",
+    "정부는 반도체 산업 지원을 위한 세제 개편안을 발표했다.",
+    "기상청은 이번 주말까지 전국에 폭염이 이어질 것으로 내다봤다.",
+    "전문가들은 물가 상승세가 연말까지 계속될 수 있다고 분석했다.",
+]
+ARTICLE = "\n".join(SENTENCES)
+
+
+def _reasons(text: str) -> list:
+    return check_content_quality(text)["reasons"]
+
+
+def _with_line(line: str) -> str:
+    return ARTICLE + "\n" + line
+
+
+def test_korean_article_passes():
+    verdict = check_content_quality(ARTICLE)
+    assert verdict["ok"] and verdict["reasons"] == []
+    assert verdict["metrics"]["korean_sentences"] == 5
+
+
+@pytest.mark.parametrize("reason, unit, repeats", [
+    ("char_run", "=", 21),         # 같은 문자 21회 이상 연속
+    ("pair_run", "=-", 31),        # 2글자 패턴 31회 이상 연속
+    ("triple_run", "=-+", 101),    # 3글자 패턴 101회 이상 연속
+])
+def test_repetition_runs(reason, unit, repeats):
+    assert _reasons(_with_line(unit * repeats)) == [reason]
+    assert _reasons(_with_line(unit * (repeats - 1))) == []
+
+
+def test_identical_chars_from_80_percent():
+    visible = sum(1 for ch in ARTICLE if not ch.isspace())
+    # 공백으로 떼어 놓아 연속 반복 규칙에는 걸리지 않게 함 (= 비율이 정확히 0.8)
+    assert _reasons(_with_line("= " * (4 * visible))) == ["identical_chars"]
+    assert _reasons(_with_line("= " * (4 * visible - 1))) == []
+
+
+def test_too_short_below_100_chars():
+    assert "too_short" in _reasons("가" * 99)
+    assert "too_short" not in _reasons("가" * 100)
+    assert "too_short" in _reasons("  " + "가" * 99 + "\n\n")
+
+
+def test_low_diversity_needs_long_text_with_few_unique_chars():
+    syllables = [chr(0xAC00 + i * 7) for i in range(50)]
+    low = ("".join(syllables[:49]) * 200)[:5001]
+    assert "low_diversity" in _reasons(low)
+    assert "low_diversity" not in _reasons(low[:5000])
+    assert "low_diversity" not in _reasons(("".join(syllables) * 200)[:5001])
+
+
+def test_repeated_sentence_from_three_copies():
+    assert _reasons(ARTICLE + "\n" + SENTENCES[0] + "\n" + SENTENCES[0]) == ["repeated_sentence"]
+    assert _reasons(ARTICLE + "\n" + SENTENCES[0]) == []
+    # 10자 미만 조각(기자명 등)은 반복돼도 문장으로 세지 않음
+    assert _reasons(ARTICLE + "\n홍길동 기자" * 3) == []
+
+
+def test_few_korean_sentences_below_five():
+    assert _reasons("\n".join(SENTENCES[:4])) == ["few_korean_sentences"]
+    # 같은 문장이 여러 번 나와도 한 번만 셈
+    assert "few_korean_sentences" in _reasons("\n".join(SENTENCES[:4] + SENTENCES[:1]))
+
+
+def test_html_tags_above_15():
+    assert _reasons(_with_line("<br>" * 16)) == ["html_tags"]
+    assert _reasons(_with_line("<br>" * 15)) == []
+
+
+def test_non_korean_above_30_percent():
+    hangul = sum(1 for ch in ARTICLE if "가" <= ch <= "힣")
+    # 영문 글자 비율이 0.3을 처음 넘는 개수
+    letters = next(k for k in range(1, 1000) if k / (hangul + k) > 0.3)
+    assert _reasons(_with_line("x " * letters)) == ["non_korean"]
+    assert _reasons(_with_line("x " * (letters - 1))) == []
+
+
+def test_boilerplate_above_half_of_line_chars():
+    article_chars = sum(len(line) for line in ARTICLE.split("\n"))
+    notice = "무단전재 및 재배포 금지 " * 100
+    assert _reasons(_with_line(notice[:article_chars + 1])) == ["boilerplate"]
+    assert _reasons(_with_line(notice[:article_chars])) == []
@@ -0,0 +1,52 @@
+# tests/test_crew_pool.py
+# generate_satire_for_team이 실패(None/부분 결과/예외)한 실행의 MemeAgentCrew를 풀에 돌려놓지 않고 폐기하는지 확인
+# 실행: python -m pytest -q tests
+import pytest
+
+
+class _FakeCrew:
+    """run_satire_generation이 정해진 결과를 돌려주는(또는 예외를 내는) MemeAgentCrew 대역"""
+
+    outcome = None
+
+    def run_satire_generation(self, keyword, why_trending):
+        if isinstance(_FakeCrew.outcome, Exception):
+            raise _FakeCrew.outcome
+        return _FakeCrew.outcome
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    import main
+
+    pool = main.MemeAgentCrewPool(max_size=1, factory=_FakeCrew)
+    monkeypatch.setattr(main, "_crew_pool", pool)
+    # 유사 요청 병합이 앞선 테스트의 결과를 돌려주지 않도록 매번 새 인덱스 사용
+    monkeypatch.setattr(main, "_trend_deduplicator", main.TrendDeduplicator())
+    return pool
+
+
+@pytest.mark.parametrize("outcome", [
+    None,
+    {"json_data": None, "satire_content": "satire", "partial": True},
+    RuntimeError("boom"),
+])
+def test_failed_run_discards_crew(pool, outcome):
+    import main
+
+    _FakeCrew.outcome = outcome
+    main.generate_satire_for_team({"keyword": "정우성", "why_trending": "Famous Korean actor trending due to rumors"})
+    stats = pool.stats()
+    assert stats["discarded"] == 1
+    assert stats["idle"] == 0 and stats["size"] == 0
+
+
+def test_successful_run_returns_crew_to_pool(pool):
+    import main
+
+    _FakeCrew.outcome = {"json_data": "{}", "satire_content": "satire"}
+    result = main.generate_satire_for_team({"keyword": "정우성", "why_trending": "Famous Korean actor trending due to rumors"})
+    assert result["satire_content"] == "satire"
+    stats = pool.stats()
+    assert stats["discarded"] == 0
+    assert stats["idle"] == 1
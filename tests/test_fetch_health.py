@@ -0,0 +1,28 @@
+# tests/test_fetch_health.py
+# 같은 도메인의 수집 결과를 여러 스레드가 동시에 기록해도 시도/실패 횟수가 빠지지 않고 백오프가 걸리는지 확인
+# 실행: python -m pytest -q tests
+from concurrent.futures import ThreadPoolExecutor
+
+
+def test_concurrent_failures_are_all_counted(isolated_caches):
+    main = isolated_caches
+    urls = [f"https://www.khan.co.kr/article/2025{i:06d}" for i in range(40)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda url: main.record_fetch_result(url, ConnectionError("reset")), urls))
+
+    health = main._domain_health.get("www.khan.co.kr")
+    assert health["attempts"] == len(urls)
+    assert health["failures"] == len(urls)
+    assert health["consecutive_failures"] == len(urls)
+    assert main.get_url_block_reason("https://www.khan.co.kr/article/new").startswith("domain www.khan.co.kr backing off")
+
+
+def test_success_resets_consecutive_failures(isolated_caches):
+    main = isolated_caches
+    for i in range(main.DOMAIN_BACKOFF_AFTER_FAILURES):
+        main.record_fetch_result(f"https://www.khan.co.kr/article/{i}", ConnectionError("reset"))
+    main.record_fetch_result("https://www.khan.co.kr/article/ok")
+
+    health = main._domain_health.get("www.khan.co.kr")
+    assert health["consecutive_failures"] == 0 and health["backoff_until"] == 0
+    assert health["failure_rate"] == main.DOMAIN_BACKOFF_AFTER_FAILURES / (main.DOMAIN_BACKOFF_AFTER_FAILURES + 1)
@@ -0,0 +1,79 @@
+# tests/test_html_charset.py
+# 기사 페이지 디코딩(decode_html)이 BOM/헤더/메타/바이트 검사 순서로 코덱을 정하고, 판단 근거를 맞게 돌려주는지 확인
+# 실행: python -m pytest -q tests
+import codecs
+
+import pytest
+
+from html_charset import decode_html, header_charset, normalize_charset
+
+TEXT = "<html><body><p>국회는 18일 본회의를 열어 똠방각하 법안을 처리했다.</p></body></html>"
+
+
+def _meta_page(charset: str) -> str:
+    return f'<html><head><meta charset="{charset}"></head><body><p>똠방각하 법안 처리</p></body></html>'
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("EUC-KR", "cp949"),
+    ("ks_c_5601-1987", "cp949"),
+    ("x-windows-949", "cp949"),
+    (' "UTF-8" ', "utf-8"),
+    ("x-unknown", None),
+    ("", None),
+    (None, None),
+])
+def test_normalize_charset(name, expected):
+    assert normalize_charset(name) == expected
+
+
+def test_header_charset():
+    assert header_charset({"Content-Type": "text/html; charset=EUC-KR"}) == "cp949"
+    assert header_charset({"Content-Type": "text/html"}) is None
+    assert header_charset(None) is None
+
+
+def test_bom_wins_over_declarations():
+    body = codecs.BOM_UTF8 + TEXT.encode("utf-8")
+    assert decode_html(body, {"Content-Type": "text/html; charset=euc-kr"}) == (TEXT, "utf-8-sig", "bom")
+
+
+def test_header_charset_decodes_cp949_only_syllables():
+    # '똠'은 EUC-KR에 없고 cp949 확장 영역에만 있음
+    assert decode_html(TEXT.encode("cp949"), {"Content-Type": "text/html; charset=euc-kr"}) == (TEXT, "cp949", "header")
+
+
+def test_meta_charset_used_without_header():
+    page = _meta_page("euc-kr")
+    assert decode_html(page.encode("cp949")) == (page, "cp949", "meta")
+
+
+def test_untrusted_header_falls_back_to_byte_check():
+    assert decode_html(TEXT.encode("utf-8"), {"Content-Type": "text/html; charset=ISO-8859-1"}) == (TEXT, "utf-8", "bytes")
+    assert decode_html(TEXT.encode("cp949"), {"Content-Type": "text/html; charset=windows-1252"}) == (TEXT, "cp949", "bytes")
+
+
+def test_wrong_declaration_moves_to_next_candidate():
+    assert decode_html(TEXT.encode("cp949"), {"Content-Type": "text/html; charset=utf-8"}) == (TEXT, "cp949", "bytes")
+    page = _meta_page("utf-8")
+    assert decode_html(page.encode("cp949")) == (page, "cp949", "bytes")
+
+
+def test_character_cut_at_byte_limit_is_dropped():
+    # 마지막 글자 '다'(3바이트)의 앞 2바이트까지만 받은 상태
+    body = TEXT.encode("utf-8")[:-len("다.</p></body></html>".encode()) + 2]
+    text, encoding, source = decode_html(body, {"Content-Type": "text/html; charset=utf-8"})
+    assert (encoding, source) == ("utf-8", "header")
+    assert text == TEXT[:TEXT.index("다.</p>")]
+
+
+def test_undecodable_bytes_fall_back_to_majority_pattern():
+    body = TEXT.encode("utf-8") + b"\xff<br>"
+    text, encoding, source = decode_html(body)
+    assert (encoding, source) == ("utf-8", "fallback")
+    assert text == TEXT + "�<br>"
+
+    body = TEXT.encode("cp949") + b"\xff<br>"
+    text, encoding, source = decode_html(body)
+    assert (encoding, source) == ("cp949", "fallback")
+    assert text == TEXT + "�<br>"
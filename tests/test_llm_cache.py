@@ -0,0 +1,155 @@
+# tests/test_llm_cache.py
+# LLM 응답 캐시(CachedLLM)의 on/refresh/replay/off 동작과, replay 모드가 실행 기록에서 검색 결과를 재생하는지 확인
+# (crewai LLM 대신 호출 횟수를 세는 가짜 base 클래스 사용, 네트워크 호출 없음)
+# 실행: python -m pytest -q tests
+import pytest
+
+MESSAGES = [{"role": "user", "content": "Summarize the issue"}]
+
+
+class _FakeLLM:
+    """crewai LLM 대역: call()이 호출될 때마다 새 응답을 돌려줌"""
+
+    def __init__(self, model: str, api_key: str = None, temperature: float = None):
+        self.model = model
+        self.temperature = temperature
+        self.calls = 0
+
+    def call(self, messages, tools=None, *args, **kwargs):
+        self.calls += 1
+        return f"response {self.calls}"
+
+
+@pytest.fixture
+def llm(isolated_caches):
+    return isolated_caches._make_cached_llm_class(_FakeLLM)(model="gemini/gemini-2.5-flash")
+
+
+@pytest.fixture
+def mode(isolated_caches, monkeypatch):
+    def _set(value):
+        monkeypatch.setattr(isolated_caches, "MEME_LLM_CACHE_MODE", value)
+    _set("on")
+    return _set
+
+
+def test_hit_serves_cached_response(llm, mode):
+    assert llm.call(MESSAGES) == "response 1"
+    assert llm.call(MESSAGES) == "response 1"
+    assert llm.calls == 1
+
+
+def test_miss_on_different_prompt_temperature_or_prompt_version(isolated_caches, llm, mode, monkeypatch):
+    llm.call(MESSAGES)
+    llm.call(MESSAGES + [{"role": "tool", "content": "search results"}])
+    llm.temperature = 0.2
+    llm.call(MESSAGES)
+    monkeypatch.setattr(isolated_caches, "MEME_LLM_PROMPT_VERSION", "2")
+    llm.call(MESSAGES)
+    assert llm.calls == 4
+
+
+def test_translation_memo_key_follows_prompt_version(isolated_caches, monkeypatch):
+    main = isolated_caches
+    key = main._translation_memo_key("정우성", "Famous Korean actor trending due to rumors")
+    # 문장부호/공백/대소문자 차이는 같은 입력으로 취급
+    assert main._translation_memo_key(" 정우성 ", "famous korean actor, trending due to rumors!") == key
+    monkeypatch.setattr(main, "MEME_LLM_PROMPT_VERSION", "2")
+    assert main._translation_memo_key("정우성", "Famous Korean actor trending due to rumors") != key
+
+
+def test_refresh_calls_model_and_overwrites(llm, mode):
+    llm.call(MESSAGES)
+    mode("refresh")
+    assert llm.call(MESSAGES) == "response 2"
+    mode("on")
+    assert llm.call(MESSAGES) == "response 2"
+    assert llm.calls == 2
+
+
+def test_replay_serves_hits_and_fails_on_miss_without_calling_model(llm, mode):
+    llm.call(MESSAGES)
+    mode("replay")
+    assert llm.call(MESSAGES) == "response 1"
+    with pytest.raises(RuntimeError, match="replay"):
+        llm.call([{"role": "user", "content": "never recorded"}])
+    assert llm.calls == 1
+
+
+def test_off_does_not_store(llm, mode):
+    mode("off")
+    llm.call(MESSAGES)
+    mode("on")
+    assert llm.call(MESSAGES) == "response 2"
+
+
+def test_model_calls_are_timed_for_the_current_run(isolated_caches, llm, mode):
+    main = isolated_caches
+    run = main.RunRecorder("이춘석", "stock trading during a plenary session")
+    token = main._current_run.set(run)
+    try:
+        llm.call(MESSAGES)
+        llm.call(MESSAGES)  # 캐시 적중은 모델 호출 시간에 넣지 않음
+    finally:
+        main._current_run.reset(token)
+    assert len(run.llm_call_seconds(llm.model)) == 1
+
+    measured = run.llm_seconds_saved(llm.model, 3, assumed_seconds=4.0)
+    assert measured["seconds_saved_basis"] == "measured"
+    assert measured["calls_measured"] == 1
+    assert measured["seconds_saved"] == pytest.approx(3 * measured["seconds_per_call"], abs=0.01)
+    assumed = run.llm_seconds_saved("gemini/gemini-2.5-pro", 3, assumed_seconds=4.0)
+    assert assumed == {"llm_calls_saved": 3, "seconds_per_call": 4.0, "calls_measured": 0,
+                       "seconds_saved": 12.0, "seconds_saved_basis": "assumed"}
+
+
+def test_replay_reuses_recorded_search_results_after_cache_expiry(isolated_caches, mode, monkeypatch):
+    main = isolated_caches
+    posts = []
+
+    def serper_post(endpoint, payload):
+        posts.append(payload)
+        return {"organic": [{"link": f"https://n.news.naver.com/article/001/{len(posts):010d}"}]}
+
+    monkeypatch.setattr(main, "_serper_post", serper_post)
+    query = '"이춘석" 최신 뉴스'
+    token = main._current_run.set(main.RunRecorder("이춘석", "stock trading during a plenary session"))
+    try:
+        recorded = main.serper_web_search(query)
+        # 검색 캐시가 만료되어 다시 검색하면 결과가 달라지는 상황
+        main._search_cache._conn().execute("DELETE FROM cache_entries WHERE namespace = 'serper_search'")
+
+        main._current_run.set(main.RunRecorder("이춘석", "stock trading during a plenary session"))
+        mode("replay")
+        assert main.serper_web_search(query) == recorded
+        assert len(posts) == 1
+        with pytest.raises(RuntimeError, match="Replay tape miss"):
+            main.serper_web_search('"이춘석" 공식입장')
+    finally:
+        main._current_run.reset(token)
+
+
+def test_replay_is_scoped_to_the_recorded_run(isolated_caches, mode, monkeypatch):
+    main = isolated_caches
+    monkeypatch.setattr(main, "_serper_post", lambda endpoint, payload: {"organic": []})
+    token = main._current_run.set(main.RunRecorder("정동원", "driving without a license"))
+    try:
+        main.serper_web_search('"정동원" 최신 뉴스')
+        mode("replay")
+        main._current_run.set(main.RunRecorder("정우성", "driving without a license"))
+        with pytest.raises(RuntimeError, match="Replay tape miss"):
+            main.serper_web_search('"정동원" 최신 뉴스')
+    finally:
+        main._current_run.reset(token)
+
+
+@pytest.mark.parametrize("name", ["gemini_pro", "gemini_flash", "gemini_flash_lite"])
+def test_crew_llms_are_cached_llm(monkeypatch, name):
+    # 설치된 crewai에서 MemeAgentCrew의 LLM이 실제로 CachedLLM인지 확인 (아니면 LLM 응답 캐시가 조용히 꺼짐)
+    pytest.importorskip("crewai")
+    import main
+
+    # 객체 생성만 확인하므로 더미 키 사용 (네트워크 호출 없음)
+    monkeypatch.setenv("GEMINI_API_KEY", "test-dummy")
+    monkeypatch.setenv("SERPER_API_KEY", "test-dummy")
+    assert type(getattr(main.MemeAgentCrew(), name)) is main._cached_llm_class()
@@ -0,0 +1,69 @@
+# tests/test_news_url.py
+# canonicalize_url이 같은 기사를 가리키는 URL 변형을 하나의 키로 합치고, 다른 기사는 구분하는지 확인
+# 실행: python -m pytest -q tests
+import pytest
+
+from news_url import canonicalize_url
+
+
+@pytest.mark.parametrize("url", [
+    "https://n.news.naver.com/article/001/0015000000",
+    "https://n.news.naver.com/mnews/article/001/0015000000?sid=100",
+    "https://m.news.naver.com/article/001/0015000000",
+    "http://news.naver.com/main/read.nhn?mode=LSD&mid=sec&sid1=100&oid=001&aid=0015000000",
+    "https://news.naver.com/main/read.naver?oid=001&aid=0015000000#comment",
+])
+def test_naver_article_variants(url):
+    assert canonicalize_url(url) == "https://n.news.naver.com/article/001/0015000000"
+
+
+def test_naver_entertainment_and_sports_keep_their_host():
+    assert canonicalize_url("https://entertain.naver.com/read?oid=609&aid=0000900000") == \
+        "https://m.entertain.naver.com/article/609/0000900000"
+    assert canonicalize_url("https://sports.news.naver.com/news?oid=477&aid=0000500000") == \
+        "https://m.sports.naver.com/article/477/0000500000"
+
+
+@pytest.mark.parametrize("url", [
+    "https://v.daum.net/v/20250909181851123",
+    "https://news.v.daum.net/v/20250909181851123?f=o",
+    "http://m.news.daum.net/v/20250909181851123",
+    "https://v.media.daum.net/v/20250909181851123#none",
+])
+def test_daum_article_variants(url):
+    assert canonicalize_url(url) == "https://v.daum.net/v/20250909181851123"
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.yna.co.kr/view/AKR20250909000100001",
+    "https://m.yna.co.kr/view/AKR20250909000100001?section=politics",
+    "http://yna.co.kr/view/AKR20250909000100001?input=1195m",
+])
+def test_yonhap_article_variants(url):
+    assert canonicalize_url(url) == "https://www.yna.co.kr/view/AKR20250909000100001"
+
+
+def test_portal_pages_that_are_not_articles_fall_back_to_generic_rules():
+    assert canonicalize_url("https://news.naver.com/section/100?utm_source=x") == "https://news.naver.com/section/100"
+    assert canonicalize_url("https://news.daum.net/politics") == "https://news.daum.net/politics"
+
+
+def test_tracking_params_removed_and_query_sorted():
+    url = "https://www.khan.co.kr/article/202509091818001?utm_source=naver&utm_medium=news&fbclid=abc&page=2&code=910100&ref=main"
+    assert canonicalize_url(url) == "https://www.khan.co.kr/article/202509091818001?code=910100&page=2"
+    assert canonicalize_url("https://www.khan.co.kr/article/1?code=&UTM_Campaign=x") == "https://www.khan.co.kr/article/1?code="
+
+
+def test_scheme_host_default_port_and_fragment():
+    assert canonicalize_url("HTTPS://WWW.Hani.co.kr:443/arti/politics/1.html#cb") == "https://www.hani.co.kr/arti/politics/1.html"
+    assert canonicalize_url("http://www.hani.co.kr:80") == "http://www.hani.co.kr/"
+    assert canonicalize_url("http://www.hani.co.kr:8080/arti/1.html") == "http://www.hani.co.kr:8080/arti/1.html"
+    # 경로의 대소문자는 유지
+    assert canonicalize_url(" https://www.chosun.com/Politics/2025/09/09/ABC/ ") == "https://www.chosun.com/Politics/2025/09/09/ABC/"
+
+
+def test_different_articles_stay_distinct():
+    assert canonicalize_url("https://n.news.naver.com/article/001/0015000000") != \
+        canonicalize_url("https://n.news.naver.com/article/001/0015000001")
+    assert canonicalize_url("https://n.news.naver.com/article/001/0015000000") != \
+        canonicalize_url("https://n.news.naver.com/article/023/0015000000")
@@ -0,0 +1,97 @@
+# tests/test_trend_dedup.py
+# TrendDeduplicator가 다른 인물의 요청을 합치지 않고, 같은 이슈의 거의 같은 요청만 합치는지 확인
+# 실행: python -m pytest -q tests
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import TrendDeduplicator
+
+LEE_REASON = (
+    "Democratic Party lawmaker Lee Choon-seok was caught trading stocks under a borrowed name "
+    "during a National Assembly plenary session."
+)
+LEE_REASON_EDITED = (
+    "Democratic Party lawmaker Lee Choon-seok caught trading stocks under a borrowed name "
+    "during the National Assembly plenary session"
+)
+PROSECUTION_REASON = "Prosecutors are investigating him over allegations raised in a recent news report."
+
+
+def _run_pair(first, second):
+    """두 요청을 차례로 실행하고 (실제 파이프라인 실행 횟수, 두 번째 결과) 반환"""
+    dedup = TrendDeduplicator()
+    calls = []
+
+    def pipeline(keyword):
+        calls.append(keyword)
+        return {"keyword": keyword}
+
+    dedup.run(first[0], first[1], lambda: pipeline(first[0]))
+    result = dedup.run(second[0], second[1], lambda: pipeline(second[0]))
+    return len(calls), result
+
+
+def test_different_people_with_generic_reason_are_not_collapsed():
+    calls, result = _run_pair(
+        ("손흥민", "Famous Korean athlete trending due to rumors"),
+        ("정우성", "Famous Korean actor trending due to rumors"),
+    )
+    assert calls == 2
+    assert result == {"keyword": "정우성"}
+
+
+def test_different_people_with_same_reason_are_not_collapsed():
+    calls, result = _run_pair(("정동원", PROSECUTION_REASON), ("정우성", PROSECUTION_REASON))
+    assert calls == 2
+    assert result == {"keyword": "정우성"}
+
+
+def test_same_person_with_title_and_edited_reason_is_collapsed():
+    calls, result = _run_pair(("이춘석", LEE_REASON), ("이춘석 의원", LEE_REASON_EDITED))
+    assert calls == 1
+    assert result == {"keyword": "이춘석", "deduplicated_from": "이춘석"}
+
+
+def test_keywords_match():
+    assert TrendDeduplicator.keywords_match("이춘석", "이춘석 의원")
+    assert TrendDeduplicator.keywords_match("BTS", "bts")
+    assert not TrendDeduplicator.keywords_match("정동원", "정우성")
+    assert not TrendDeduplicator.keywords_match("손흥민", "정우성")
+
+
+def test_partial_result_is_not_reused():
+    dedup = TrendDeduplicator()
+    calls = []
+
+    def pipeline(partial):
+        calls.append(partial)
+        return {"satire_content": "satire", "partial": True} if partial else {"satire_content": "satire"}
+
+    dedup.run("이춘석", LEE_REASON, lambda: pipeline(True))
+    result = dedup.run("이춘석", LEE_REASON, lambda: pipeline(False))
+    assert calls == [True, False]
+    assert "deduplicated_from" not in result
+    # 완전한 결과는 이후 같은 요청에 재사용
+    assert dedup.run("이춘석", LEE_REASON, lambda: pipeline(False))["deduplicated_from"] == "이춘석"
+
+
+def test_wait_for_in_flight_request_is_bounded():
+    dedup = TrendDeduplicator(wait_timeout=0.1)
+    release = threading.Event()
+    first = threading.Thread(target=dedup.run, args=("이춘석", LEE_REASON, lambda: release.wait(5) and {"keyword": "first"}))
+    first.start()
+    try:
+        while dedup.stats()["started"] == 0:
+            time.sleep(0.01)
+        start = time.monotonic()
+        result = dedup.run("이춘석 의원", LEE_REASON_EDITED, lambda: {"keyword": "second"})
+        assert time.monotonic() - start < 2
+        assert result == {"keyword": "second"}
+        assert dedup.stats()["wait_timeouts"] == 1
+    finally:
+        release.set()
+        first.join()